@@ -4,14 +4,17 @@ Scheduler script for Member Moments app.
 Runs the main application at specified intervals.
 """
 
+import asyncio
 import schedule
-import time
 import subprocess
 import sys
 import os
+import tempfile
 from datetime import datetime
 import logging
 
+from src.main import run as run_pipeline
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,31 +25,79 @@ logging.basicConfig(
     ]
 )
 
+# Arguments for each scheduled run
+RUN_CSV = 'companies_with_locations.csv'
+RUN_CONFIG = 'config.yaml'
+RUN_SINCE_DAYS = 1
+
+# Set MEMBER_MOMENTS_SUBPROCESS=1 to run each job in a fresh interpreter instead of in-process
+USE_SUBPROCESS = os.environ.get('MEMBER_MOMENTS_SUBPROCESS') == '1'
+
 def run_member_moments():
     """Run the Member Moments application"""
+    if USE_SUBPROCESS:
+        run_member_moments_subprocess()
+        return
+    
     try:
         logging.info("Starting Member Moments run...")
         
-        # Run the main application
-        result = subprocess.run([
-            sys.executable, '-m', 'src.main',
-            '--csv', 'companies_with_locations.csv',
-            '--config', 'config.yaml',
-            '--since_days', '1'
-        ], capture_output=True, text=True, cwd=os.getcwd())
+        # Call the pipeline directly, skipping interpreter startup and re-imports on every run
+        run_pipeline(RUN_CSV, RUN_CONFIG, RUN_SINCE_DAYS)
+        
+        logging.info("Member Moments run completed successfully")
+        
+    except Exception as e:
+        logging.error(f"Exception occurred while running Member Moments: {e}")
+
+def run_member_moments_subprocess():
+    """Run the Member Moments application in a separate Python process"""
+    try:
+        logging.info("Starting Member Moments run (subprocess)...")
         
-        if result.returncode == 0:
-            logging.info("Member Moments run completed successfully")
-            if result.stdout:
-                logging.info(f"Output: {result.stdout}")
-        else:
-            logging.error(f"Member Moments run failed with return code {result.returncode}")
-            if result.stderr:
-                logging.error(f"Error: {result.stderr}")
+        # Run the main application, spooling its output to temp files rather than in-memory pipes
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            result = subprocess.run([
+                sys.executable, '-m', 'src.main',
+                '--csv', RUN_CSV,
+                '--config', RUN_CONFIG,
+                '--since_days', str(RUN_SINCE_DAYS)
+            ], stdout=out, stderr=err, cwd=os.getcwd())
+            
+            if result.returncode == 0:
+                logging.info("Member Moments run completed successfully")
+            else:
+                logging.error(f"Member Moments run failed with return code {result.returncode}")
+                out.seek(0)
+                err.seek(0)
+                stdout = out.read().decode('utf-8', errors='replace')
+                stderr = err.read().decode('utf-8', errors='replace')
+                if stdout:
+                    logging.error(f"Output: {stdout}")
+                if stderr:
+                    logging.error(f"Error: {stderr}")
                 
     except Exception as e:
         logging.error(f"Exception occurred while running Member Moments: {e}")
 
+async def run_scheduler():
+    """Sleep until the next scheduled job is due, then run it off the event loop"""
+    loop = asyncio.get_running_loop()
+    
+    # Run once immediately
+    logging.info("Running initial job...")
+    await loop.run_in_executor(None, run_member_moments)
+    
+    # Keep the scheduler running, waking only when a job is due instead of polling
+    while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            logging.info("No scheduled jobs left, exiting scheduler")
+            return
+        if idle > 0:
+            await asyncio.sleep(idle)
+        await loop.run_in_executor(None, schedule.run_pending)
+
 def main():
     """Main scheduler function"""
     logging.info("Starting Member Moments scheduler...")
@@ -63,14 +114,7 @@ def main():
     for job in schedule.get_jobs():
         logging.info(f"  - {job}")
     
-    # Run once immediately
-    logging.info("Running initial job...")
-    run_member_moments()
-    
-    # Keep the scheduler running
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+    asyncio.run(run_scheduler())
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,26 @@
 import re
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Optional, Iterable, FrozenSet
+from dataclasses import dataclass
 from urllib.parse import urlparse
-import requests
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, cached_property
+from bs4 import BeautifulSoup
+
+from .utils import ARTICLE_SESSION, wait_for_host
+
+# Upper bound on how much of an article page is downloaded and scanned
+_MAX_ARTICLE_BYTES = 200_000
+
+# Fetched articles by URL, shared by the companies verified against the same article. Entries
+# expire after ARTICLE_CACHE_TTL seconds, so a long-lived process doesn't hold pages (or serve
+# them stale) beyond the batch of verifications that fetched them.
+ARTICLE_CACHE_SIZE = 256
+ARTICLE_CACHE_TTL = 600
+_article_cache = OrderedDict()
+_article_cache_lock = threading.Lock()
 
 # Common false positive patterns that indicate personal names or unrelated content
 PERSON_NAME_PATTERNS = [
@@ -32,15 +50,24 @@ NON_BUSINESS_CONTEXT_PATTERNS = [
     r'\beducation\b', r'\bschool\b', r'\buniversity\b', r'\bstudent\b', r'\bteacher\b'
 ]
 
+# Compiled once at import so the per-article loops don't re-probe the re cache
+_PERSON_NAME_RES = [re.compile(p) for p in PERSON_NAME_PATTERNS]
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Every context pattern is a \bword\b literal, so a match is exactly a whole \w+ token
+_BIZ_WORDS = frozenset(p[2:-2] for p in BUSINESS_CONTEXT_PATTERNS)
+_NONBIZ_WORDS = frozenset(p[2:-2] for p in NON_BUSINESS_CONTEXT_PATTERNS)
+
 # Generic terms that often cause false positives
-GENERIC_TERMS = [
+GENERIC_TERMS = frozenset([
     'the', 'and', 'or', 'for', 'with', 'from', 'about', 'new', 'old', 'big', 'small',
     'good', 'bad', 'high', 'low', 'fast', 'slow', 'hot', 'cold', 'open', 'close',
     'start', 'stop', 'begin', 'end', 'first', 'last', 'next', 'previous'
-]
+])
 
 # High-risk single-word company names that require extra verification
-HIGH_RISK_SINGLE_WORDS = [
+HIGH_RISK_SINGLE_WORDS = frozenset([
     'advance', 'agency', 'house', 'home', 'work', 'play', 'go', 'get', 'make', 'take',
     'see', 'look', 'find', 'help', 'care', 'love', 'life', 'time', 'day', 'way',
     'world', 'city', 'town', 'place', 'space', 'room', 'door', 'window', 'light',
@@ -49,7 +76,7 @@ HIGH_RISK_SINGLE_WORDS = [
     'friend', 'team', 'group', 'club', 'band', 'show', 'game', 'play', 'book', 'film',
     'music', 'art', 'food', 'drink', 'shop', 'store', 'bank', 'school', 'church',
     'hospital', 'hotel', 'restaurant', 'cafe', 'bar', 'park', 'road', 'street', 'avenue'
-]
+])
 
 def extract_domain_from_url(url: str) -> str:
     """Extract clean domain from URL"""
@@ -67,8 +94,8 @@ def is_likely_person_name(text: str) -> bool:
     text = text.strip()
     
     # Check against person name patterns
-    for pattern in PERSON_NAME_PATTERNS:
-        if re.search(pattern, text):
+    for pattern in _PERSON_NAME_RES:
+        if pattern.search(text):
             return True
     
     # Check for titles that indicate a person
@@ -92,40 +119,70 @@ def is_likely_person_name(text: str) -> bool:
 
 def has_business_context(text: str) -> bool:
     """Check if text contains business-related context"""
-    text_lower = text.lower()
+    return _has_business_context_tokens(_WORD_RE.findall(text.lower()))
+
+def _has_business_context_tokens(tokens: Iterable[str]) -> bool:
+    """has_business_context for text already split into lowercase word tokens"""
+    # Count distinct business / non-business indicators by set intersection
+    net_business_score = len(_BIZ_WORDS.intersection(tokens)) - len(_NONBIZ_WORDS.intersection(tokens))
     
-    # Count business context indicators
-    business_score = 0
-    for pattern in BUSINESS_CONTEXT_PATTERNS:
-        if re.search(pattern, text_lower):
-            business_score += 1
+    # Return True only if we have a strong positive business context
+    return net_business_score >= 2
+
+@dataclass
+class ArticleFeatures:
+    """
+    Article-only data, computed once and shared by every company verified against the article.
+    html_lower is the raw page used for domain checks; when empty the text is used instead.
+    """
+    text_lower: str
+    html_lower: str = ""
     
-    # Count non-business context indicators (negative score)
-    non_business_score = 0
-    for pattern in NON_BUSINESS_CONTEXT_PATTERNS:
-        if re.search(pattern, text_lower):
-            non_business_score += 1
+    @classmethod
+    def from_content(cls, article_text: str, article_html: str = "") -> 'ArticleFeatures':
+        return cls(article_text.lower(), article_html.lower())
     
-    # Calculate net business score
-    net_business_score = business_score - non_business_score
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        return frozenset(_WORD_RE.findall(self.text_lower))
     
-    # Return True only if we have a strong positive business context
-    return net_business_score >= 2
+    @cached_property
+    def has_business_context(self) -> bool:
+        return _has_business_context_tokens(self.tokens)
 
 def calculate_name_similarity(company_name: str, article_text: str) -> Tuple[float, str]:
     """
     Calculate similarity between company name and article text.
     Returns (similarity_score, match_type)
     """
-    company_name = company_name.lower().strip()
-    article_text = article_text.lower()
+    return _name_similarity(company_name, ArticleFeatures.from_content(article_text))
+
+@lru_cache(maxsize=8192)
+def _company_name_forms(company_name: str) -> Tuple[str, Tuple[str, ...], Tuple[str, ...], bool]:
+    """
+    Per-company derived name data, cached since each company is checked against many articles.
+    Returns (lowercased name, whitespace parts, \w+ words, whether every part is a plain word)
+    """
+    name_lower = company_name.lower().strip()
+    parts = tuple(name_lower.split())
+    words = tuple(_WORD_RE.findall(name_lower))
+    return name_lower, parts, words, all(part.isalnum() for part in parts)
+
+def _name_similarity(company_name: str, features: ArticleFeatures) -> Tuple[float, str]:
+    """calculate_name_similarity against precomputed article features"""
+    company_name, company_parts, company_words, plain_parts = _company_name_forms(company_name)
+    article_text = features.text_lower
     
     # Exact match (highest confidence)
     if company_name in article_text:
         return 1.0, "exact_match"
     
+    # Fast path: no part of a multi-word name occurs in the article. Unless a part carries
+    # punctuation (e.g. "a-b c"), none of the word-level checks below can match either
+    if plain_parts and len(company_parts) > 1 and not any(part in article_text for part in company_parts):
+        return 0.0, "no_match"
+    
     # Check for company name with slight variations (spaces, punctuation)
-    company_words = re.findall(r'\b\w+\b', company_name)
     if len(company_words) > 1:
         # Multi-word company name
         all_words_present = all(word in article_text for word in company_words)
@@ -133,7 +190,6 @@ def calculate_name_similarity(company_name: str, article_text: str) -> Tuple[flo
             return 0.95, "all_words_present"
     
     # Check for partial matches (but be more strict)
-    company_parts = company_name.split()
     if len(company_parts) > 1:
         # For multi-word names, require at least 2/3 of words to match
         matching_parts = sum(1 for part in company_parts if part in article_text)
@@ -147,14 +203,14 @@ def calculate_name_similarity(company_name: str, article_text: str) -> Tuple[flo
         # High-risk single words require domain verification AND business context
         if word in HIGH_RISK_SINGLE_WORDS:
             # For high-risk words, require both domain verification AND strong business context
-            if has_business_context(article_text):
+            if features.has_business_context:
                 return 0.4, "high_risk_single_word_with_context"
             else:
                 return 0.1, "high_risk_single_word_no_context"
         
         # Regular single words - still strict but not as harsh
         if word not in GENERIC_TERMS and word in article_text:
-            if has_business_context(article_text):
+            if features.has_business_context:
                 return 0.6, "single_word_business_context"
             else:
                 return 0.2, "single_word_no_context"
@@ -163,6 +219,17 @@ def calculate_name_similarity(company_name: str, article_text: str) -> Tuple[flo
     
     return 0.0, "no_match"
 
+# Words that, directly after the company name, indicate the article is about the company
+COMPANY_INDICATOR_SUFFIXES = [
+    'announces', 'launches', 'raises', 'appoints', 'expands', 'reports', 'earnings',
+    'revenue', 'stock', 'shares', 'ceo', 'cto', 'headquarters', 'office', 'location'
+]
+
+@lru_cache(maxsize=4096)
+def _company_indicator_re(company_name_lower: str) -> re.Pattern:
+    """One pattern per company matching any "<name> <indicator>" phrase (plain substring semantics)"""
+    return re.compile(re.escape(company_name_lower) + ' (?:' + '|'.join(COMPANY_INDICATOR_SUFFIXES) + ')')
+
 def is_company_specific_mention(company_name: str, article_text: str, company_domains: List[str]) -> bool:
     """
     Check if the article is specifically about the company vs. just using the word in a different context.
@@ -171,52 +238,66 @@ def is_company_specific_mention(company_name: str, article_text: str, company_do
     company_name_lower = company_name.lower()
     article_text_lower = article_text.lower()
     
-    # Check for company-specific indicators
-    company_indicators = [
-        f"{company_name_lower} announces",
-        f"{company_name_lower} launches", 
-        f"{company_name_lower} raises",
-        f"{company_name_lower} appoints",
-        f"{company_name_lower} expands",
-        f"{company_name_lower} reports",
-        f"{company_name_lower} earnings",
-        f"{company_name_lower} revenue",
-        f"{company_name_lower} stock",
-        f"{company_name_lower} shares",
-        f"{company_name_lower} ceo",
-        f"{company_name_lower} cto",
-        f"{company_name_lower} headquarters",
-        f"{company_name_lower} office",
-        f"{company_name_lower} location"
-    ]
-    
-    # Check if any company-specific indicators are present
-    for indicator in company_indicators:
-        if indicator in article_text_lower:
-            return True
+    # Check for company-specific indicators ("<name> announces", "<name> ceo", ...)
+    if _company_indicator_re(company_name_lower).search(article_text_lower):
+        return True
     
     # Check if company name appears in proper noun context (capitalized)
     # This helps distinguish "Apple" (company) from "apple" (fruit)
     company_words = company_name.split()
     for word in company_words:
-        if word.lower() in article_text_lower:
+        context_before = article_text_lower.find(word.lower())
+        if context_before != -1:
             # Look for capitalized version in context
             capitalized_word = word.capitalize()
             if capitalized_word in article_text:
                 # Check if it's in a business context
-                context_before = article_text_lower.find(word.lower())
                 context_after = context_before + len(word)
                 
-                # Look for business context around the mention
+                # Look for business context around the mention, tokenizing in place rather than slicing
                 start = max(0, context_before - 50)
                 end = min(len(article_text_lower), context_after + 50)
-                context_window = article_text_lower[start:end]
                 
-                if has_business_context(context_window):
+                if _has_business_context_tokens(_WORD_RE.findall(article_text_lower, start, end)):
                     return True
     
     return False
 
+def _visible_text(html: str) -> str:
+    """Strip tags, scripts and styles from an HTML page, leaving the readable text"""
+    soup = BeautifulSoup(html, 'lxml')
+    for tag in soup(['script', 'style', 'noscript']):
+        tag.decompose()
+    return soup.get_text(separator=' ')
+
+def _fetch_article(article_url: str) -> ArticleFeatures:
+    """
+    Fetch an article, rate limited per host to be respectful to news sites.
+    Returns features of the raw page and its visible text; cached by URL (see _article_cache)
+    since the same article is often verified against several companies. Errors aren't cached.
+    """
+    with _article_cache_lock:
+        entry = _article_cache.get(article_url)
+        if entry is not None and entry[0] > time.monotonic():
+            _article_cache.move_to_end(article_url)
+            return entry[1]
+    
+    wait_for_host(article_url)
+    
+    # Only the head and lead of the page matter, so stop reading after _MAX_ARTICLE_BYTES
+    with ARTICLE_SESSION.get(article_url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        raw = response.raw.read(_MAX_ARTICLE_BYTES, decode_content=True)
+        html = raw.decode(response.encoding or 'utf-8', errors='replace')
+    features = ArticleFeatures.from_content(_visible_text(html), html)
+    
+    with _article_cache_lock:
+        _article_cache[article_url] = (time.monotonic() + ARTICLE_CACHE_TTL, features)
+        _article_cache.move_to_end(article_url)
+        if len(_article_cache) > ARTICLE_CACHE_SIZE:
+            _article_cache.popitem(last=False)
+    return features
+
 def verify_company_mention(company_name: str, company_domains: List[str], 
                           article_url: str, article_title: str, 
                           verbose: bool = False, test_mode: bool = False) -> Tuple[bool, str, float]:
@@ -227,35 +308,102 @@ def verify_company_mention(company_name: str, company_domains: List[str],
     if not company_domains:
         return False, "No company domains to verify", 0.0
     
-    # First, check if any company domain appears in the article
-    domain_verified = False
-    domain_note = ""
+    # Articles hosted on the company's own domain need no fetch to prove the domain
+    url_domain = "" if test_mode else _domain_in_url(company_domains, article_url)
+    if url_domain:
+        return verify_company_mention_with_features(company_name, company_domains,
+                                                    ArticleFeatures.from_content(article_title),
+                                                    verbose, test_mode, url_domain=url_domain)
     
     if not test_mode:
         try:
-            # Add a small delay to be respectful to news sites
-            time.sleep(0.5)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; MemberMoments/1.0; +https://github.com/pbouffaut/Member-Moments)'
-            }
-            
-            response = requests.get(article_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            article_content = response.text
+            features = _fetch_article(article_url)
         except Exception as e:
             if verbose:
                 print(f"[VERIFY] Error fetching article: {e}")
-            article_content = article_title  # Fall back to title only
+            features = ArticleFeatures.from_content(article_title)  # Fall back to title only
     else:
-        article_content = article_title  # Test mode
+        features = ArticleFeatures.from_content(article_title)  # Test mode
+    
+    return verify_company_mention_with_features(company_name, company_domains, features, verbose, test_mode)
+
+def _domain_in_url(company_domains: List[str], article_url: str) -> str:
+    """Return the first company domain contained in the article URL, or an empty string"""
+    url_lower = article_url.lower()
+    for domain in company_domains:
+        if domain.lower() in url_lower:
+            return domain
+    return ""
+
+def verify_company_mentions_batch(items: List[Tuple[str, List[str], str, str]],
+                                  verbose: bool = False, test_mode: bool = False,
+                                  max_workers: int = 16) -> List[Tuple[bool, str, float]]:
+    """
+    Verify many (company_name, company_domains, article_url, article_title) items at once.
+    Articles are fetched concurrently with one worker per host, and the per-host rate
+    limit still applies. Returns results in input order, as verify_company_mention would.
+    """
+    contents = {}
+    if not test_mode:
+        urls_by_host = {}
+        for _, company_domains, article_url, _ in items:
+            if company_domains and not _domain_in_url(company_domains, article_url):
+                urls_by_host.setdefault(extract_domain_from_url(article_url), {})[article_url] = None
+        
+        def fetch_host(urls):
+            fetched = {}
+            for url in urls:
+                try:
+                    fetched[url] = _fetch_article(url)
+                except Exception as e:
+                    if verbose:
+                        print(f"[VERIFY] Error fetching article: {e}")
+            return fetched
+        
+        if urls_by_host:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(urls_by_host))) as executor:
+                for fetched in executor.map(fetch_host, urls_by_host.values()):
+                    contents.update(fetched)
+    
+    results = []
+    for company_name, company_domains, article_url, article_title in items:
+        if not company_domains:
+            results.append((False, "No company domains to verify", 0.0))
+            continue
+        url_domain = "" if test_mode else _domain_in_url(company_domains, article_url)
+        features = contents.get(article_url)
+        if features is None:
+            features = ArticleFeatures.from_content(article_title)  # Fall back to title only
+        results.append(verify_company_mention_with_features(company_name, company_domains, features,
+                                                            verbose, test_mode, url_domain=url_domain))
+    return results
+
+def verify_company_mention_with_features(company_name: str, company_domains: List[str],
+                                         features: ArticleFeatures,
+                                         verbose: bool = False, test_mode: bool = False,
+                                         url_domain: str = "") -> Tuple[bool, str, float]:
+    """
+    verify_company_mention against an already-fetched article's features, for pipelines that
+    check many companies against the same article.
+    url_domain is set when a company domain was already found in the article URL.
+    """
+    # First, check if any company domain appears in the article
+    domain_verified = False
+    domain_note = ""
+    
+    if test_mode:
         domain_verified = True
         domain_note = "Test mode - domain verification simulated"
+    elif url_domain:
+        domain_verified = True
+        domain_note = f"Domain '{url_domain}' found in article URL"
     
-    # Check domain presence
-    if not test_mode:
-        for domain in company_domains:
-            if domain.lower() in article_content.lower():
+    # Check domain presence against the raw page, since domains often only appear in links
+    if not test_mode and not domain_verified:
+        html_lower = features.html_lower or features.text_lower
+        domain_lowers = [d.lower() for d in company_domains]
+        for domain, domain_lower in zip(company_domains, domain_lowers):
+            if domain_lower in html_lower:
                 domain_verified = True
                 domain_note = f"Domain '{domain}' found in article"
                 break
@@ -264,7 +412,7 @@ def verify_company_mention(company_name: str, company_domains: List[str],
             domain_note = "No company domains found in article content"
     
     # Check name similarity and context
-    name_similarity, match_type = calculate_name_similarity(company_name, article_content)
+    name_similarity, match_type = _name_similarity(company_name, features)
     
     # Check if company name looks like a person's name
     is_person_name = is_likely_person_name(company_name)
@@ -289,7 +437,7 @@ def verify_company_mention(company_name: str, company_domains: List[str],
             verification_note = f"Low confidence: {domain_note}, {match_type}"
     else:
         # No domain verification - much lower confidence
-        if name_similarity > 0.9 and has_business_context(article_content):
+        if name_similarity > 0.9 and features.has_business_context:
             confidence = 0.6
             verification_note = f"Domain not verified, but strong name match with business context: {match_type}"
         else:
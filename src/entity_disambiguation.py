@@ -1,16 +1,245 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import logging
+import random
+import sqlite3
 from typing import Dict, List, Optional, Tuple
 import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Knowledge Graph @type values that mark an entity as a company/organization
+COMPANY_TYPES = frozenset(['Organization', 'Corporation', 'Company', 'Business', 'EducationalOrganization'])
+
+class RateLimiter:
+    """
+    Thread-safe limiter for Knowledge Graph calls. Enforces a sliding-window requests-per-minute
+    cap and adapts concurrency AIMD-style: halved on 429/5xx, raised by 0.5 on each success.
+    Retry-After and a nearly exhausted X-RateLimit-Remaining pause all callers.
+    """
+    
+    def __init__(self, rpm: int = 600, min_concurrency: int = 1, max_concurrency: int = 16):
+        self.rpm = rpm
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self._in_flight = 0
+        self._sent = deque()  # monotonic timestamps of calls in the last minute
+        self._pause_until = 0.0
+        self._cond = threading.Condition()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= 60:
+                    self._sent.popleft()
+                
+                if self._pause_until > now:
+                    timeout = self._pause_until - now
+                elif len(self._sent) >= self.rpm:
+                    timeout = 60 - (now - self._sent[0])
+                elif self._in_flight >= int(self.concurrency):
+                    timeout = None  # woken by release()
+                else:
+                    self._sent.append(now)
+                    self._in_flight += 1
+                    return
+                self._cond.wait(timeout)
+    
+    def release(self, response: Optional[requests.Response] = None):
+        """Return the slot taken by acquire(), adjusting limits from the response if there is one"""
+        with self._cond:
+            self._in_flight -= 1
+            if response is not None:
+                self._on_response(response)
+            self._cond.notify_all()
+    
+    def _on_response(self, response: requests.Response):
+        now = time.monotonic()
+        if response.status_code == 429 or response.status_code >= 500:
+            # Multiplicative decrease, and back off for as long as the server asks
+            self.concurrency = max(self.min_concurrency, self.concurrency * 0.5)
+            self._pause_until = max(self._pause_until, now + self._retry_after(response))
+            return
+        
+        # Additive increase on success
+        self.concurrency = min(self.max_concurrency, self.concurrency + 0.5)
+        
+        # Pause proactively when the quota is nearly used up
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        limit = response.headers.get('X-RateLimit-Limit')
+        if remaining and limit and remaining.isdigit() and limit.isdigit() and int(remaining) <= int(limit) * 0.1:
+            self._pause_until = max(self._pause_until, now + self._retry_after(response))
+    
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        retry_after = response.headers.get('Retry-After', '')
+        return float(retry_after) if retry_after.isdigit() else 1.0
+
+def get_with_retry(session: requests.Session, url: str, params: Dict, rate_limiter: RateLimiter,
+                   max_attempts: int = 4, timeout=10) -> requests.Response:
+    """
+    GET url through the rate limiter. Connection errors, timeouts, 429 and 5xx are retried with
+    exponential backoff plus jitter; other 4xx errors raise immediately. Every attempt is
+    acquired and released through the limiter, so it sees each 429/5xx and Retry-After is
+    honored by holding acquire() until it has passed. Sessions passed in should not retry
+    on status themselves, or the limiter never sees those responses.
+    """
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
+        response = None
+        rate_limiter.acquire()
+        try:
+            response = session.get(url, params=params, timeout=timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if last_attempt:
+                raise
+        finally:
+            rate_limiter.release(response)
+        
+        if response is not None:
+            if response.status_code != 429 and response.status_code < 500:
+                response.raise_for_status()
+                return response
+            if last_attempt:
+                response.raise_for_status()
+        
+        time.sleep(min(8.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.5))
+
+class KGCache:
+    """
+    Thread-safe LRU of Knowledge Graph lookups, optionally backed by a SQLite file so the same
+    companies don't hit the API again across runs. Entries expire after ttl seconds, empty ones
+    (no results) after negative_ttl. If the file can't be opened or written, the cache keeps
+    working in memory only.
+    """
+    
+    def __init__(self, size: int = 4096, path: Optional[str] = None, ttl: float = 86400,
+                 negative_ttl: Optional[float] = None):
+        self.size = size
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, ts)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            db = None
+            try:
+                db = sqlite3.connect(path, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL;")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS kg_response_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)"
+                )
+                db.commit()
+                self._db = db
+            except sqlite3.Error as e:
+                logger.warning("[KG_CACHE] Can't use %s, caching in memory only: %s", path, e)
+                if db is not None:
+                    db.close()
+    
+    def _fresh(self, value, ts: float, now: float) -> bool:
+        return now - ts < (self.ttl if value else self.negative_ttl)
+    
+    def lookup(self, key: str) -> Tuple[bool, object]:
+        """(True, value) for a fresh cached entry, else (False, None)"""
+        now = time.time()
+        row = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._fresh(*entry, now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[0]
+                del self._entries[key]
+            if self._db is not None:
+                try:
+                    row = self._db.execute("SELECT value, ts FROM kg_response_cache WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning("[KG_CACHE] Read failed: %s", e)
+        if row is not None:
+            value = json.loads(row[0])
+            if self._fresh(value, row[1], now):
+                with self._lock:
+                    self.hits += 1
+                    self._remember(key, value, row[1])
+                return True, value
+        with self._lock:
+            self.misses += 1
+        return False, None
+    
+    def put(self, key: str, value):
+        """Cache a JSON-serializable value in memory and, if there is one, in the file"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO kg_response_cache (key, value, ts) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), now)
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("[KG_CACHE] Write failed: %s", e)
+    
+    def _remember(self, key: str, value, ts: float):
+        self._entries[key] = (value, ts)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current in-memory size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries)
+            }
+    
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
 class EntityDisambiguator:
     """
     Uses Google Knowledge Graph API to disambiguate company names and verify entities
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, rate_limiter: Optional[RateLimiter] = None, cache_size: int = 10000,
+                 cache_path: Optional[str] = None, cache_ttl: int = 86400, max_attempts: int = 4):
         self.api_key = api_key
         self.base_url = "https://kgsearch.googleapis.com/v1/entities:search"
+        self.rate_limiter = rate_limiter or RateLimiter()
+        
+        # Pooled keep-alive session. Retries happen in _get_with_retry rather than in the adapter,
+        # so every attempt goes through the rate limiter and it sees each 429/5xx.
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=100))
+        self.max_attempts = max_attempts
+        
+        # Lookups keyed by (company_name, query); the same companies recur across many articles
+        # in a run and are rescored every day. Entries older than cache_ttl seconds are refetched.
+        self._cache = KGCache(cache_size, cache_path, cache_ttl)
+    
+    def close(self):
+        """Release pooled connections and the on-disk cache"""
+        self.session.close()
+        self._cache.close()
     
     def disambiguate_company(self, company_name: str, article_context: str = "") -> Dict:
         """
@@ -20,88 +249,125 @@ class EntityDisambiguator:
         if not self.api_key:
             return self._fallback_disambiguation(company_name, article_context)
         
+        # Build query with context
+        query = company_name
+        if article_context:
+            # Add context to help disambiguation
+            context_words = article_context.split(None, 10)[:10]  # First 10 words for context, without splitting the rest
+            query = f"{company_name} {' '.join(context_words)}"
+        
+        key = json.dumps([company_name, query])
+        found, result = self._cache.lookup(key)
+        if found:
+            return result
         try:
-            # Build query with context
-            query = company_name
-            if article_context:
-                # Add context to help disambiguation
-                context_words = article_context.split()[:10]  # First 10 words for context
-                query = f"{company_name} {' '.join(context_words)}"
-            
-            params = {
-                'query': query,
-                'key': self.api_key,
-                'limit': 5,  # Get top 5 results
-                'types': 'Organization|Corporation|Company',  # Focus on business entities
-                'indent': True
-            }
-            
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'itemListElement' in data and data['itemListElement']:
-                # Process results
-                results = []
-                for item in data['itemListElement']:
-                    if 'result' in item:
-                        result = item['result']
-                        score = item.get('resultScore', 0)
-                        
-                        entity_info = {
-                            'name': result.get('name', ''),
-                            'type': result.get('@type', []),
-                            'description': result.get('description', ''),
-                            'url': result.get('url', ''),
-                            'score': score,
-                            'is_company': self._is_company_entity(result),
-                            'confidence': self._calculate_confidence(result, company_name, score)
-                        }
-                        results.append(entity_info)
-                
-                # Return best match
-                if results:
-                    best_match = max(results, key=lambda x: x['confidence'])
-                    return {
-                        'is_verified': best_match['confidence'] > 0.7,
-                        'confidence': best_match['confidence'],
-                        'entity_name': best_match['name'],
-                        'entity_type': best_match['type'],
-                        'description': best_match['description'],
-                        'url': best_match['url'],
-                        'disambiguation_results': results
-                    }
-            
-            # No good matches found
-            return {
-                'is_verified': False,
-                'confidence': 0.0,
-                'entity_name': company_name,
-                'entity_type': [],
-                'description': '',
-                'url': '',
-                'disambiguation_results': []
-            }
-            
+            result = self._search_company(company_name, query)
         except Exception as e:
-            print(f"[DISAMBIGUATION] Error with Google Knowledge Graph API: {e}")
+            logger.warning("[DISAMBIGUATION] Error with Google Knowledge Graph API: %s", e)
             return self._fallback_disambiguation(company_name, article_context)
+        self._cache.put(key, result)
+        return result
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters for the lookup cache"""
+        return self._cache.stats()
+    
+    def _search_company(self, company_name: str, query: str) -> Dict:
+        """Query the Knowledge Graph and pick the best match; raises on API errors"""
+        params = {
+            'query': query,
+            'key': self.api_key,
+            'limit': 5,  # Get top 5 results
+            'types': 'Organization|Corporation|Company'  # Focus on business entities
+        }
+        
+        response = self._get_with_retry(params)
+        data = response.json()
+        
+        if 'itemListElement' in data and data['itemListElement']:
+            # Process results
+            results = []
+            best_match = None
+            company_name_lower = company_name.lower()
+            for item in data['itemListElement']:
+                if 'result' in item:
+                    result = item['result']
+                    score = item.get('resultScore', 0)
+                    is_company = self._is_company_entity(result)
+                    
+                    entity_info = {
+                        'name': result.get('name', ''),
+                        'type': result.get('@type', []),
+                        'description': result.get('description', ''),
+                        'url': result.get('url', ''),
+                        'score': score,
+                        'is_company': is_company,
+                        'confidence': self._calculate_confidence(result, company_name_lower, score, is_company)
+                    }
+                    results.append(entity_info)
+                    
+                    # Track the best match as we go (first one wins on ties, like max())
+                    if best_match is None or entity_info['confidence'] > best_match['confidence']:
+                        best_match = entity_info
+            
+            # Return best match
+            if best_match is not None:
+                return {
+                    'is_verified': best_match['confidence'] > 0.7,
+                    'confidence': best_match['confidence'],
+                    'entity_name': best_match['name'],
+                    'entity_type': best_match['type'],
+                    'description': best_match['description'],
+                    'url': best_match['url'],
+                    'disambiguation_results': results
+                }
+        
+        # No good matches found
+        return {
+            'is_verified': False,
+            'confidence': 0.0,
+            'entity_name': company_name,
+            'entity_type': [],
+            'description': '',
+            'url': '',
+            'disambiguation_results': []
+        }
+
+    def _get_with_retry(self, params: Dict) -> requests.Response:
+        return get_with_retry(self.session, self.base_url, params, self.rate_limiter, self.max_attempts)
+    
+    def disambiguate_many(self, items: List[Tuple[str, str]], concurrency: int = 16) -> List[Dict]:
+        """
+        Disambiguate many (company_name, article_context) pairs, running up to `concurrency`
+        API calls at once. Returns results in input order.
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+            return list(executor.map(lambda item: self.disambiguate_company(*item), items))
+    
+    def disambiguate_batch(self, names: List[str], context: str = "", concurrency: int = 16) -> Dict[str, Dict]:
+        """
+        Disambiguate a list of company names sharing one context, keyed by name.
+        The Knowledge Graph search endpoint takes a single free-text query per request, so
+        duplicate names are collapsed and the remaining lookups fan out concurrently.
+        """
+        unique_names = list(dict.fromkeys(names))
+        results = self.disambiguate_many([(name, context) for name in unique_names], concurrency=concurrency)
+        return dict(zip(unique_names, results))
     
     def _is_company_entity(self, entity: Dict) -> bool:
         """Check if the entity is a company/organization"""
-        entity_types = entity.get('@type', [])
-        company_types = ['Organization', 'Corporation', 'Company', 'Business', 'EducationalOrganization']
-        return any(t in entity_types for t in company_types)
+        return not COMPANY_TYPES.isdisjoint(entity.get('@type', []))
     
-    def _calculate_confidence(self, entity: Dict, company_name: str, score: float) -> float:
-        """Calculate confidence score for the entity match"""
+    def _calculate_confidence(self, entity: Dict, company_name_lower: str, score: float,
+                              is_company: Optional[bool] = None) -> float:
+        """Calculate confidence score for the entity match; company_name_lower is the lowercased query name"""
         # Normalize Google's score (usually 0-1000)
         normalized_score = min(score / 1000.0, 1.0)
         
         # Boost confidence if names are very similar
         entity_name = entity.get('name', '').lower()
-        company_name_lower = company_name.lower()
         
         if entity_name == company_name_lower:
             name_boost = 0.3
@@ -111,7 +377,9 @@ class EntityDisambiguator:
             name_boost = 0.0
         
         # Boost if it's clearly a company
-        company_boost = 0.2 if self._is_company_entity(entity) else 0.0
+        if is_company is None:
+            is_company = self._is_company_entity(entity)
+        company_boost = 0.2 if is_company else 0.0
         
         final_confidence = normalized_score + name_boost + company_boost
         return min(final_confidence, 1.0)
@@ -1,71 +1,108 @@
 import re
-from typing import Tuple
+from typing import List, Optional, Tuple
 
-FUNDING_PATTERNS = [
-    r"series\s+[A-E]", r"\bseed\b", r"\bpre-seed\b", r"\bround\b",
+FUNDING_PATTERNS = (
+    r"series\s+[a-e]", r"\bseed\b", r"\bpre-seed\b", r"\bround\b",
     r"\$\s?\d+(\.\d+)?\s?(m|b)\b", r"\d+\s?(million|billion)\b"
-]
-EXEC_PATTERNS = [
-    r"\bCEO\b|\bCTO\b|\bCFO\b|\bChief\b|\bChief\s+\w+",
+)
+EXEC_PATTERNS = (
+    r"\bceo\b|\bcto\b|\bcfo\b|\bchief\b|\bchief\s+\w+",
     r"\bappoints?\b|\bjoins?\b|\bsteps\s+down\b|\bresigns?\b|\bleaves?\b"
-]
-HIRING_PATTERNS = [
+)
+HIRING_PATTERNS = (
     r"\bhiring\b", r"\bopen roles\b", r"\bnow hiring\b", r"\bgrowing team\b", r"\bexpanding\b"
-]
-LAUNCH_PATTERNS = [
+)
+LAUNCH_PATTERNS = (
     r"\blaunch(es|ed|ing)?\b", r"\brelease(s|d|ing)?\b", r"\bunveil(s|ed|ing)?\b"
-]
-AWARD_PATTERNS = [
+)
+AWARD_PATTERNS = (
 
     r"\baward(s)?\b", r"\bwinner\b", r"\brecognition\b", r"\bhonor(?:ed)?\b"
-]
+)
+
+LAYOFFS_PATTERNS = (
+    r"\blayoff(s)?\b", r"\bworkforce reduction\b", r"\bstaff cuts?\b",
+    r"\bjob cuts?\b", r"\bredundanc(y|ies)\b", r"\bdownsizing\b",
+    r"\bheadcount reduction\b"
+)
+SECURITY_PATTERNS = (
+    r"\bdata breach\b", r"\bsecurity incident\b", r"\bcyber ?attack\b",
+    r"\bransomware\b", r"\bhacked\b", r"\bcompromise(d)?\b"
+)
+
+def _fuse(patterns):
+    """
+    One compiled alternation per category, so each category costs a single search.
+    Patterns are written in lowercase and matched against lowercased text, so no IGNORECASE.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+# (event_type, confidence, pattern) in priority order: the first category that matches wins.
+# Categories stay separate searches because a single fused regex would report the leftmost
+# match in the text rather than the highest-priority category.
+EVENT_CATEGORIES = (
+    ("FUNDING", 0.9, _fuse(FUNDING_PATTERNS)),
+    ("EXEC_CHANGE", 0.75, _fuse(EXEC_PATTERNS)),
+    ("HIRING", 0.6, _fuse(HIRING_PATTERNS)),
+    ("PRODUCT_LAUNCH", 0.6, _fuse(LAUNCH_PATTERNS)),
+    ("AWARD", 0.6, _fuse(AWARD_PATTERNS)),
+    ("LAYOFFS", 0.95, _fuse(LAYOFFS_PATTERNS)),
+    ("SECURITY_INCIDENT", 0.9, _fuse(SECURITY_PATTERNS)),
+)
+
+# Literals at least one of which every event pattern above needs to match. Most headlines
+# contain none of them and are classified as PRESS_MENTION after this single scan.
+# Keep in sync when adding patterns.
+PREFILTER_LITERALS = (
+    "series", "seed", "round", "$", "million", "billion",
+    "ceo", "cto", "cfo", "chief", "appoint", "join", "steps", "resign", "leave",
+    "hiring", "open roles", "growing team", "expanding",
+    "launch", "release", "unveil",
+    "award", "winner", "recognition", "honor",
+    "layoff", "workforce reduction", "staff cut", "job cut", "redundanc", "downsizing", "headcount reduction",
+    "data breach", "security incident", "cyber", "ransomware", "hacked", "compromise",
+)
+PREFILTER_RE = re.compile("|".join(re.escape(lit) for lit in PREFILTER_LITERALS))
 
 def classify_event(title: str, snippet: str = "") -> Tuple[str, float]:
-    text = f"{title or ''} {snippet or ''}".lower()
+    return _classify_text(f"{title or ''} {snippet or ''}".lower())
 
-    def match_any(patterns):
-        return any(re.search(p, text, re.IGNORECASE) for p in patterns)
+def classify_events_batch(titles: List[str], snippets: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+    """
+    Classify many articles in one call; same results as classify_event per (title, snippet).
+    Raises ValueError if snippets is given and doesn't pair up with titles.
+    """
+    if snippets is None:
+        snippets = [""] * len(titles)
+    elif len(snippets) != len(titles):
+        raise ValueError(f"classify_events_batch got {len(titles)} titles but {len(snippets)} snippets")
+    return [_classify_text(f"{title or ''} {snippet or ''}".lower()) for title, snippet in zip(titles, snippets)]
 
-    if match_any(FUNDING_PATTERNS):
-        return ("FUNDING", 0.9)
-    if match_any(EXEC_PATTERNS):
-        return ("EXEC_CHANGE", 0.75)
-    if match_any(HIRING_PATTERNS):
-        return ("HIRING", 0.6)
-    if match_any(LAUNCH_PATTERNS):
-        return ("PRODUCT_LAUNCH", 0.6)
-    if match_any(AWARD_PATTERNS):
-        return ("AWARD", 0.6)
-    if match_any(LAYOFFS_PATTERNS):
-        return ("LAYOFFS", 0.95)
-    if match_any(SECURITY_PATTERNS):
-        return ("SECURITY_INCIDENT", 0.9)
+def _classify_text(text: str) -> Tuple[str, float]:
+    if not PREFILTER_RE.search(text):
+        return ("PRESS_MENTION", 0.5)
+    for event_type, confidence, pattern in EVENT_CATEGORIES:
+        if pattern.search(text):
+            return (event_type, confidence)
     return ("PRESS_MENTION", 0.5)
 
-def score_severity(event_type: str, source_domain: str = "") -> float:
-    base = {
-        "FUNDING": 0.9,
-        "EXEC_CHANGE": 0.75,
-        "HIRING": 0.55,
-        "PRODUCT_LAUNCH": 0.65,
-        "AWARD": 0.6,
-        "PRESS_MENTION": 0.5,
-        "LAYOFFS": 0.85,
-        "SECURITY_INCIDENT": 0.8,
-    }.get(event_type, 0.5)
+BASE_SEVERITY = {
+    "FUNDING": 0.9,
+    "EXEC_CHANGE": 0.75,
+    "HIRING": 0.55,
+    "PRODUCT_LAUNCH": 0.65,
+    "AWARD": 0.6,
+    "PRESS_MENTION": 0.5,
+    "LAYOFFS": 0.85,
+    "SECURITY_INCIDENT": 0.8,
+}
 
-    high_auth = ["techcrunch.com", "theverge.com", "wsj.com", "ft.com", "reuters.com", "bloomberg.com"]
-    if any(h in (source_domain or "") for h in high_auth):
-        base += 0.1
+# Sources whose coverage bumps severity; matched as substrings of the source domain
+HIGH_AUTH_DOMAINS = ("techcrunch.com", "theverge.com", "wsj.com", "ft.com", "reuters.com", "bloomberg.com")
+HIGH_AUTH_RE = re.compile("|".join(re.escape(d) for d in HIGH_AUTH_DOMAINS))
 
+def score_severity(event_type: str, source_domain: str = "") -> float:
+    base = BASE_SEVERITY.get(event_type, 0.5)
+    if source_domain and HIGH_AUTH_RE.search(source_domain):
+        base += 0.1
     return min(1.0, base)
-
-LAYOFFS_PATTERNS = [
-    r"\blayoff(s)?\b", r"\bworkforce reduction\b", r"\bstaff cuts?\b",
-    r"\bjob cuts?\b", r"\bredundanc(y|ies)\b", r"\bdownsizing\b",
-    r"\bheadcount reduction\b"
-]
-SECURITY_PATTERNS = [
-    r"\bdata breach\b", r"\bsecurity incident\b", r"\bcyber ?attack\b",
-    r"\bransomware\b", r"\bhacked\b", r"\bcompromise(d)?\b"
-]
@@ -1,20 +1,143 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import logging
 import re
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
-import time
 from urllib.parse import quote_plus
 
+from .entity_disambiguation import KGCache, RateLimiter, get_with_retry
+
+logger = logging.getLogger(__name__)
+
+# Substrings of a KG description that mark the entity as a company/organization
+COMPANY_INDICATORS = (
+    'company', 'corporation', 'inc', 'llc', 'ltd', 'startup', 'tech',
+    'software', 'platform', 'service', 'organization', 'business',
+    'academy', 'institute', 'university', 'college', 'school',
+    'agency', 'foundation', 'association', 'group', 'team'
+)
+
+# Single-pass scan for any company indicator in a (short) KG description
+COMPANY_INDICATOR_RE = re.compile('|'.join(re.escape(indicator) for indicator in COMPANY_INDICATORS))
+
+# KG @type values that count as a company for match scoring
+COMPANY_TYPES = frozenset(['Organization', 'Corporation', 'Company', 'EducationalOrganization'])
+
+# Entity types requested from the KG search; results of other types aren't returned
+COMPANY_SEARCH_TYPES = 'Organization|Corporation|Company|EducationalOrganization'
+
+# Description substrings that raise the match score, 0.2 each
+MATCH_DESCRIPTION_INDICATORS = ('company', 'business', 'organization', 'startup', 'tech')
+
+# Substrings of article text that indicate business context
+BUSINESS_INDICATORS = (
+    'company', 'corporation', 'inc', 'llc', 'ltd', 'startup', 'tech',
+    'software', 'platform', 'service', 'announces', 'launches', 'raises',
+    'funding', 'partnership', 'merger', 'acquisition', 'appoints', 'ceo',
+    'cto', 'headquarters', 'office', 'location', 'expansion'
+)
+
+# Description keywords per field, used to tell whether search results span unrelated domains
+DOMAIN_KEYWORDS = {
+    'sports': ['game', 'team', 'player', 'tournament', 'league', 'championship'],
+    'business': ['company', 'corporation', 'business', 'office', 'ceo', 'startup'],
+    'geography': ['city', 'town', 'country', 'region', 'state', 'province'],
+    'entertainment': ['movie', 'show', 'actor', 'director', 'film', 'series'],
+    'technology': ['software', 'app', 'platform', 'tech', 'digital', 'online']
+}
+# One alternation per domain, matching keywords anywhere in the description like `kw in desc`
+DOMAIN_REGEXES = {
+    domain: re.compile('|'.join(re.escape(kw) for kw in keywords))
+    for domain, keywords in DOMAIN_KEYWORDS.items()
+}
+
+PERSON_TITLES = frozenset(['mr', 'mrs', 'ms', 'dr', 'professor', 'prof', 'sir', 'madam'])
+
+# ASCII "First Last": two words, each an uppercase letter followed by characters that include a
+# lowercase letter and no uppercase ones (what str.isupper/str.islower accept for ASCII)
+PERSON_NAME_RE = re.compile(r'[A-Z](?=[^A-Z\s]*[a-z])[^A-Z\s]+\s+[A-Z](?=[^A-Z\s]*[a-z])[^A-Z\s]+')
+
+# Words that are always generic, checked before any dynamic analysis
+DEFINITELY_GENERIC = frozenset([
+    'yes', 'no', 'maybe', 'sure', 'ok', 'fine', 'good', 'bad',
+    'up', 'down', 'in', 'out', 'left', 'right', 'high', 'low'
+])
+
+# Common business false positives, used when there is no API key for dynamic analysis
+BUSINESS_GENERIC = frozenset([
+    'advance', 'agency', 'new', 'old', 'big', 'small',
+    'company', 'business', 'organization', 'team', 'group'
+])
+
+@lru_cache(maxsize=2048)
+def _normalized_name_similarity(name1_lower: str, name2_lower: str) -> float:
+    """
+    Similarity between two names that are already lowercased and stripped. Memoized because the
+    same (query, candidate) pair is scored when filtering and again when ranking.
+    """
+    if name1_lower == name2_lower:
+        return 1.0
+    
+    # Check if one contains the other
+    if name1_lower in name2_lower or name2_lower in name1_lower:
+        return 0.8
+    
+    # Check word overlap
+    words1 = set(name1_lower.split())
+    words2 = set(name2_lower.split())
+    
+    if not words1 or not words2:
+        return 0.0
+    
+    intersection = words1.intersection(words2)
+    union = words1.union(words2)
+    
+    return len(intersection) / len(union)
+
 class GoogleKnowledgeGraphDisambiguator:
     """
     Uses Google Knowledge Graph API to disambiguate company names and verify entities
     Much broader coverage than Wikidata, especially for smaller companies
     """
     
-    def __init__(self, api_key: str = ""):
+    def __init__(self, api_key: str = "", cache_size: int = 4096,
+                 cache_path: Optional[str] = None, cache_ttl: int = 7 * 86400,
+                 negative_cache_ttl: int = 86400, rate_limiter: Optional[RateLimiter] = None,
+                 max_attempts: int = 4):
         self.api_key = api_key
         self.base_url = "https://kgsearch.googleapis.com/v1/entities:search"
         
+        # Pooled keep-alive session so repeated searches reuse the TLS connection. Retries happen
+        # in get_with_retry rather than in the adapter, so the rate limiter sees each 429/5xx.
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self.max_attempts = max_attempts
+        self.session.headers.update({'Accept': 'application/json'})
+        # The API key goes on every request; requests merges session params with per-call ones
+        self.session.params = {'key': api_key}
+        # Shared across disambiguate_companies workers so fan-out stays under the API quota
+        self.rate_limiter = rate_limiter or RateLimiter()
+        
+        # Search responses are cached in an in-memory LRU, optionally backed by SQLite at
+        # cache_path, so the same company names recurring across articles and across daily runs
+        # don't hit the API again. Empty responses are cached too, for less time, so recurring
+        # false-positive names (e.g. "advance") stop costing a request per article.
+        self._cache = KGCache(cache_size, cache_path, cache_ttl, negative_cache_ttl)
+        
+    def close(self):
+        """Release pooled connections and the on-disk cache"""
+        self.session.close()
+        self._cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def disambiguate_company(self, company_name: str, article_context: str = "") -> Dict:
         """
         Disambiguate a company name using Google Knowledge Graph API
@@ -23,6 +146,10 @@ class GoogleKnowledgeGraphDisambiguator:
         if not self.api_key:
             return self._no_api_key_fallback(company_name)
         
+        # Words that are always generic are false positives whatever the KG says; skip the call
+        if self._is_generic_word(company_name, fast=True):
+            return self._generic_word_fallback(company_name)
+        
         try:
             # Search for the company name with context
             search_results = self._search_entities(company_name, article_context)
@@ -53,24 +180,29 @@ class GoogleKnowledgeGraphDisambiguator:
             }
             
         except Exception as e:
-            print(f"[GOOGLE_KG] Error during disambiguation: {e}")
+            logger.warning("[GOOGLE_KG] Error during disambiguation: %s", e)
             return self._fallback_disambiguation(company_name, article_context)
     
+    def disambiguate_companies(self, items: List[Tuple[str, str]], concurrency: int = 16) -> List[Dict]:
+        """
+        Disambiguate many (company_name, article_context) pairs with up to `concurrency` lookups
+        in flight; a slot frees as soon as its lookup finishes. Returns results in input order.
+        API calls are further throttled by the rate limiter, and the session pool (20) covers
+        the default worker count. Repeated pairs (e.g. a syndicated headline) are looked up once
+        and share the result.
+        """
+        if not items:
+            return []
+        unique = list(dict.fromkeys(items))
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique))) as executor:
+            results = dict(zip(unique, executor.map(lambda item: self.disambiguate_company(*item), unique)))
+        return [results[item] for item in items]
+    
     def _fallback_disambiguation(self, company_name: str, article_context: str = "") -> Dict:
         """Fallback disambiguation using basic logic when Google KG fails"""
         # Check if this is a generic word that commonly causes false positives
         if self._is_generic_word(company_name):
-            return {
-                'is_verified': False,
-                'confidence': 0.0,
-                'entity_name': company_name,
-                'entity_type': [],
-                'description': 'Generic word - likely false positive',
-                'url': '',
-                'wikidata_id': '',
-                'disambiguation_results': [],
-                'source': 'fallback_logic'
-            }
+            return self._fallback(company_name, 0.0, 'Generic word - likely false positive', 'fallback_logic')
         
         # Basic company verification logic
         is_verified = False
@@ -90,226 +222,109 @@ class GoogleKnowledgeGraphDisambiguator:
                 confidence = 0.2
                 description = "No business context - low confidence"
         
-        return {
-            'is_verified': confidence >= 0.6,
-            'confidence': confidence,
-            'entity_name': company_name,
-            'entity_type': [],
-            'description': description,
-            'url': '',
-            'wikidata_id': '',
-            'disambiguation_results': [],
-            'source': 'fallback_logic'
-        }
+        return self._fallback(company_name, confidence, description, 'fallback_logic')
     
     def _search_entities(self, query: str, context: str = "") -> List[Dict]:
         """Search Google Knowledge Graph for entities matching the query"""
         try:
-            # Build search query with context if available
-            search_query = query
-            if context:
-                # Add context words to improve search
-                context_words = context.split()[:5]  # First 5 words
-                search_query = f"{query} {' '.join(context_words)}"
-            
-            # For company searches, add business context
+            # For company searches without much context, add business context; otherwise add
+            # the first context words to improve search
             if not context or len(context) < 20:
                 search_query = f"{query} company business organization"
+            else:
+                context_words = context.split(None, 5)[:5]  # First 5 words, without splitting the rest
+                search_query = f"{query} {' '.join(context_words)}"
             
             params = {
                 'query': search_query,
-                'key': self.api_key,
                 'limit': 20,  # Increase limit to get more results
-                'types': 'Organization|Corporation|Company|EducationalOrganization',
-                'indent': True
+                'types': COMPANY_SEARCH_TYPES
             }
             
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'itemListElement' in data:
-                return data['itemListElement']
-            
-            # If no results with types filter, try without it
-            params.pop('types')
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'itemListElement' in data:
-                return data['itemListElement']
-            
-            return []
+            items = self._query(params)
+            if items is None:
+                # If no results with types filter, try without it
+                params.pop('types')
+                items = self._query(params)
+            return items or []
             
         except Exception as e:
-            print(f"[GOOGLE_KG] Search error: {e}")
+            logger.warning("[GOOGLE_KG] Search error: %s", e)
             return []
     
+    def _query(self, params: Dict) -> Optional[List[Dict]]:
+        """
+        Run one entities:search request and return its itemListElement, or None if the response
+        has none. Served from the cache when possible; raises on API errors.
+        """
+        key = json.dumps(params, sort_keys=True).lower()
+        found, items = self._cache.lookup(key)
+        if found:
+            return items
+        
+        # (connect, read) timeouts so a stalled socket doesn't hold a pool slot for long
+        response = get_with_retry(self.session, self.base_url, params, self.rate_limiter,
+                                  self.max_attempts, timeout=(3, 7))
+        items = response.json().get('itemListElement')
+        
+        self._cache.put(key, items)
+        return items
+    
     def _filter_company_results(self, search_results: List[Dict], company_name: str) -> List[Dict]:
         """Filter results to focus on company/organization entities"""
         company_results = []
+        company_name_lower = company_name.lower().strip()
         
         for item in search_results:
             if 'result' in item:
-                result = item['result']
+                # Copy so adding the score doesn't modify the cached search response
+                result = dict(item['result'])
                 # Check if it's likely a company/organization
-                if self._is_likely_company(result, company_name):
+                if self._is_likely_company(result, company_name, company_name_lower):
                     # Add the result score for ranking
                     result['score'] = item.get('resultScore', 0)
                     company_results.append(result)
         
         return company_results
     
-    def _is_likely_company(self, result: Dict, company_name: str) -> bool:
-        """Check if the result is likely a company/organization"""
+    def _is_likely_company(self, result: Dict, company_name: str, company_name_lower: Optional[str] = None) -> bool:
+        """
+        Check if the result is likely a company/organization.
+        company_name_lower (lowercased, stripped) can be passed to avoid renormalizing per result.
+        """
         description = result.get('description', '').lower()
-        name = result.get('name', '').lower()
-        
-        # Company/organization indicators
-        company_indicators = [
-            'company', 'corporation', 'inc', 'llc', 'ltd', 'startup', 'tech',
-            'software', 'platform', 'service', 'organization', 'business',
-            'academy', 'institute', 'university', 'college', 'school',
-            'agency', 'foundation', 'association', 'group', 'team'
-        ]
         
         # Check description for company indicators
-        for indicator in company_indicators:
-            if indicator in description:
-                return True
-        
-        # Check if name matches company name well
-        if self._name_similarity(company_name, name) > 0.6:
+        if COMPANY_INDICATOR_RE.search(description):
             return True
         
-        # If we have a good name match and any description, consider it
-        if self._name_similarity(company_name, name) > 0.8 and description:
-            return True
+        if company_name_lower is None:
+            company_name_lower = company_name.lower().strip()
         
-        return False
+        # Check if name matches company name well (a >0.8 match with a description is covered too)
+        return _normalized_name_similarity(company_name_lower, result.get('name', '').lower().strip()) > 0.6
     
     def _name_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity between two names"""
-        name1_lower = name1.lower().strip()
-        name2_lower = name2.lower().strip()
-        
-        if name1_lower == name2_lower:
-            return 1.0
-        
-        # Check if one contains the other
-        if name1_lower in name2_lower or name2_lower in name1_lower:
-            return 0.8
-        
-        # Check word overlap
-        words1 = set(name1_lower.split())
-        words2 = set(name2_lower.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union)
-    
-    def _get_entity_details(self, entity_id: str) -> Optional[Dict]:
-        """Get detailed information about a Wikidata entity"""
-        try:
-            url = f"{self.entity_url}{entity_id}.json"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            entities = data.get('entities', {})
-            entity = entities.get(entity_id, {})
-            
-            if not entity:
-                return None
-            
-            # Extract entity information
-            labels = entity.get('labels', {})
-            descriptions = entity.get('descriptions', {})
-            claims = entity.get('claims', {})
-            
-            # Get English label and description
-            label = labels.get('en', {}).get('value', '') if 'en' in labels else ''
-            description = descriptions.get('en', {}).get('value', '') if 'en' in descriptions else ''
-            
-            # Get entity types
-            types = self._extract_entity_types(claims)
-            
-            # Get website URL if available
-            website = self._extract_website(claims)
-            
-            return {
-                'wikidata_id': entity_id,
-                'name': label,
-                'description': description,
-                'types': types,
-                'website': website,
-                'url': f"{self.entity_url}{entity_id}",
-                'claims': claims
-            }
-            
-        except Exception as e:
-            print(f"[WIKIDATA] Error getting entity details: {e}")
-            return None
-    
-    def _extract_entity_types(self, claims: Dict) -> List[str]:
-        """Extract entity types from Wikidata claims"""
-        types = []
-        
-        # Check for instance of (P31) claims
-        if 'P31' in claims:
-            for claim in claims['P31']:
-                if 'mainsnak' in claim and 'datavalue' in claim['mainsnak']:
-                    value = claim['mainsnak']['datavalue'].get('value', {})
-                    if isinstance(value, dict) and 'id' in value:
-                        entity_id = value['id']
-                        # Map common entity types
-                        type_mapping = {
-                            'Q43229': 'Organization',
-                            'Q783794': 'Company',
-                            'Q15636249': 'Startup',
-                            'Q4671277': 'Corporation',
-                            'Q159364': 'Educational Institution',
-                            'Q16917': 'University',
-                            'Q4671277': 'Corporation',
-                            'Q163740': 'Non-profit Organization'
-                        }
-                        if entity_id in type_mapping:
-                            types.append(type_mapping[entity_id])
-        
-        return types
-    
-    def _extract_website(self, claims: Dict) -> str:
-        """Extract website URL from Wikidata claims"""
-        if 'P856' in claims:  # Official website property
-            for claim in claims['P856']:
-                if 'mainsnak' in claim and 'datavalue' in claim['mainsnak']:
-                    value = claim['mainsnak']['datavalue'].get('value', '')
-                    if value:
-                        return value
-        return ""
+        return _normalized_name_similarity(name1.lower().strip(), name2.lower().strip())
     
     def _find_best_match(self, results: List[Dict], company_name: str, context: str = "") -> Dict:
         """Find the best matching entity from the results"""
         if not results:
             return self._default_result(company_name)
         
-        # Score each result
-        scored_results = []
+        # Score each result, keeping the highest (the first one on ties)
+        company_name_lower = company_name.lower().strip()
+        best_result, best_score = None, -1.0
         for result in results:
-            score = self._calculate_match_score(result, company_name, context)
-            scored_results.append((result, score))
-        
-        # Sort by score (highest first)
-        scored_results.sort(key=lambda x: x[1], reverse=True)
-        
-        best_result, best_score = scored_results[0]
+            # Upper bound with full type, description and Google scores; skip results that can't
+            # beat the current best (ties keep the earlier one anyway)
+            name_sim = _normalized_name_similarity(company_name_lower, result.get('name', '').lower().strip())
+            if min(name_sim * 0.4 + 0.3 + 0.2 + 0.1, 1.0) <= best_score:
+                continue
+            score = self._calculate_match_score(result, company_name, context, company_name_lower)
+            if score > best_score:
+                best_result, best_score = result, score
         
         return {
             'id': best_result.get('id', ''),
@@ -320,29 +335,27 @@ class GoogleKnowledgeGraphDisambiguator:
             'confidence': best_score
         }
     
-    def _calculate_match_score(self, result: Dict, company_name: str, context: str = "") -> float:
+    def _calculate_match_score(self, result: Dict, company_name: str, context: str = "",
+                               company_name_lower: Optional[str] = None) -> float:
         """Calculate a match score for the entity"""
         score = 0.0
+        if company_name_lower is None:
+            company_name_lower = company_name.lower().strip()
         
         # Name similarity (40% of score)
-        name_sim = self._name_similarity(company_name, result.get('name', ''))
+        name_sim = _normalized_name_similarity(company_name_lower, result.get('name', '').lower().strip())
         score += name_sim * 0.4
         
         # Type relevance (30% of score)
-        type_score = 0.0
-        company_types = ['Organization', 'Corporation', 'Company', 'EducationalOrganization']
-        for entity_type in result.get('@type', []):
-            if entity_type in company_types:
-                type_score = 1.0
-                break
+        type_score = 0.0 if COMPANY_TYPES.isdisjoint(result.get('@type', ())) else 1.0
         score += type_score * 0.3
         
         # Description relevance (20% of score)
         desc_score = 0.0
-        if result.get('description'):
-            desc_lower = result['description'].lower()
-            company_indicators = ['company', 'business', 'organization', 'startup', 'tech']
-            for indicator in company_indicators:
+        description = result.get('description')
+        if description:
+            desc_lower = description.lower()
+            for indicator in MATCH_DESCRIPTION_INDICATORS:
                 if indicator in desc_lower:
                     desc_score += 0.2
             desc_score = min(desc_score, 1.0)
@@ -362,12 +375,14 @@ class GoogleKnowledgeGraphDisambiguator:
         text = text.strip()
         
         # Check for titles that indicate a person
-        person_titles = ['mr', 'mrs', 'ms', 'dr', 'professor', 'prof', 'sir', 'madam']
-        words = text.lower().split()
-        if words and words[0] in person_titles:
+        first_word = text.split(None, 1)[:1]
+        if first_word and first_word[0].lower() in PERSON_TITLES:
             return True
         
         # Check if it follows "First Last" pattern with proper capitalization
+        if text.isascii():
+            return PERSON_NAME_RE.fullmatch(text) is not None
+        
         parts = text.split()
         if len(parts) == 2:
             if (parts[0][0].isupper() and parts[0][1:].islower() and 
@@ -383,46 +398,33 @@ class GoogleKnowledgeGraphDisambiguator:
             
         text_lower = text.lower()
         
-        # Business context indicators
-        business_indicators = [
-            'company', 'corporation', 'inc', 'llc', 'ltd', 'startup', 'tech',
-            'software', 'platform', 'service', 'announces', 'launches', 'raises',
-            'funding', 'partnership', 'merger', 'acquisition', 'appoints', 'ceo',
-            'cto', 'headquarters', 'office', 'location', 'expansion'
-        ]
-        
-        # Count business indicators
+        # Count business indicators, stopping at the second
         business_score = 0
-        for indicator in business_indicators:
+        for indicator in BUSINESS_INDICATORS:
             if indicator in text_lower:
                 business_score += 1
+                if business_score >= 2:
+                    return True
         
-        return business_score >= 2
+        return False
     
-    def _is_generic_word(self, text: str) -> bool:
-        """Check if text is a generic word that could cause false positives"""
+    def _is_generic_word(self, text: str, fast: bool = False) -> bool:
+        """
+        Check if text is a generic word that could cause false positives.
+        With fast=True the API is never consulted, so with an API key only DEFINITELY_GENERIC counts.
+        """
         text_lower = text.lower().strip()
         
-        # Static list of definitely generic words (fast fallback)
-        definitely_generic = [
-            'yes', 'no', 'maybe', 'sure', 'ok', 'fine', 'good', 'bad',
-            'up', 'down', 'in', 'out', 'left', 'right', 'high', 'low'
-        ]
-        
-        if text_lower in definitely_generic:
+        # Static set of definitely generic words (fast fallback)
+        if text_lower in DEFINITELY_GENERIC:
             return True
         
         # For other words, use dynamic analysis if we have API access
         if self.api_key:
-            return self._is_generic_word_dynamic(text)
-        
-        # Fallback to static list for common business false positives
-        business_generic = [
-            'advance', 'agency', 'new', 'old', 'big', 'small',
-            'company', 'business', 'organization', 'team', 'group'
-        ]
+            return False if fast else self._is_generic_word_dynamic(text)
         
-        return text_lower in business_generic
+        # Fallback to static set for common business false positives
+        return text_lower in BUSINESS_GENERIC
     
     def _is_generic_word_dynamic(self, text: str) -> bool:
         """Dynamically determine if a word is generic using Google Knowledge Graph analysis"""
@@ -437,7 +439,7 @@ class GoogleKnowledgeGraphDisambiguator:
             return self._analyze_result_diversity(search_results, text)
             
         except Exception as e:
-            print(f"[GOOGLE_KG] Dynamic generic word analysis failed: {e}")
+            logger.warning("[GOOGLE_KG] Dynamic generic word analysis failed: %s", e)
             return False  # Fallback to static analysis
     
     def _search_entities_raw(self, query: str) -> List[Dict]:
@@ -445,23 +447,13 @@ class GoogleKnowledgeGraphDisambiguator:
         try:
             params = {
                 'query': query,
-                'key': self.api_key,
-                'limit': 15,
-                'indent': True
+                'limit': 15
             }
             
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'itemListElement' in data:
-                return data['itemListElement']
-            
-            return []
+            return self._query(params) or []
             
         except Exception as e:
-            print(f"[GOOGLE_KG] Raw search error: {e}")
+            logger.warning("[GOOGLE_KG] Raw search error: %s", e)
             return []
     
     def _analyze_result_diversity(self, search_results: List[Dict], query: str) -> bool:
@@ -495,18 +487,9 @@ class GoogleKnowledgeGraphDisambiguator:
         name_diversity = len(set(names))
         
         # Check if results are from completely different domains
-        domain_keywords = {
-            'sports': ['game', 'team', 'player', 'tournament', 'league', 'championship'],
-            'business': ['company', 'corporation', 'business', 'office', 'ceo', 'startup'],
-            'geography': ['city', 'town', 'country', 'region', 'state', 'province'],
-            'entertainment': ['movie', 'show', 'actor', 'director', 'film', 'series'],
-            'technology': ['software', 'app', 'platform', 'tech', 'digital', 'online']
-        }
-        
         domain_scores = {}
-        for domain, keywords in domain_keywords.items():
-            score = sum(1 for desc in descriptions if any(kw in desc for kw in keywords))
-            domain_scores[domain] = score
+        for domain, pattern in DOMAIN_REGEXES.items():
+            domain_scores[domain] = sum(1 for desc in descriptions if pattern.search(desc))
         
         # If we have high diversity across multiple domains, it's likely generic
         active_domains = sum(1 for score in domain_scores.values() if score > 0)
@@ -526,75 +509,44 @@ class GoogleKnowledgeGraphDisambiguator:
         
         return is_generic
 
-    def _no_api_key_fallback(self, company_name: str) -> Dict:
-        """Fallback when no API key is provided"""
+    def _fallback(self, company_name: str, confidence: float, description: str,
+                  source: str = 'google_knowledge_graph') -> Dict:
+        """Result without a Knowledge Graph match; every fallback shares this shape"""
         return {
-            'is_verified': False,
-            'confidence': 0.3,
+            'is_verified': confidence >= 0.6,
+            'confidence': confidence,
             'entity_name': company_name,
             'entity_type': [],
-            'description': 'Google Knowledge Graph API key not provided',
+            'description': description,
             'url': '',
             'wikidata_id': '',
             'disambiguation_results': [],
-            'source': 'google_knowledge_graph'
+            'source': source
         }
     
+    def _no_api_key_fallback(self, company_name: str) -> Dict:
+        """Fallback when no API key is provided"""
+        return self._fallback(company_name, 0.3, 'Google Knowledge Graph API key not provided')
+    
     def _no_results_fallback(self, company_name: str) -> Dict:
         """Fallback when no search results found"""
         # Check if this looks like a generic word that could cause false positives
         if self._is_generic_word(company_name):
-            return {
-                'is_verified': False,
-                'confidence': 0.0,
-                'entity_name': company_name,
-                'entity_type': [],
-                'description': 'Generic word - likely false positive',
-                'url': '',
-                'wikidata_id': '',
-                'disambiguation_results': [],
-                'source': 'google_knowledge_graph'
-            }
+            return self._generic_word_fallback(company_name)
         else:
-            return {
-                'is_verified': False,
-                'confidence': 0.0,
-                'entity_name': company_name,
-                'entity_type': [],
-                'description': 'No Google Knowledge Graph results found',
-                'url': '',
-                'wikidata_id': '',
-                'disambiguation_results': [],
-                'source': 'google_knowledge_graph'
-            }
+            return self._fallback(company_name, 0.0, 'No Google Knowledge Graph results found')
+    
+    def _generic_word_fallback(self, company_name: str) -> Dict:
+        """Result for a generic word that is likely a false positive"""
+        return self._fallback(company_name, 0.0, 'Generic word - likely false positive')
     
     def _no_company_results_fallback(self, company_name: str) -> Dict:
         """Fallback when no company results found"""
-        return {
-            'is_verified': False,
-            'confidence': 0.2,
-            'entity_name': company_name,
-            'entity_type': [],
-            'description': 'No company entities found in Google Knowledge Graph',
-            'url': '',
-            'wikidata_id': '',
-            'disambiguation_results': [],
-            'source': 'google_knowledge_graph'
-        }
+        return self._fallback(company_name, 0.2, 'No company entities found in Google Knowledge Graph')
     
     def _error_fallback(self, company_name: str, error: str) -> Dict:
         """Fallback when errors occur"""
-        return {
-            'is_verified': False,
-            'confidence': 0.1,
-            'entity_name': company_name,
-            'entity_type': [],
-            'description': f'Error: {error}',
-            'url': '',
-            'wikidata_id': '',
-            'disambiguation_results': [],
-            'source': 'google_knowledge_graph'
-        }
+        return self._fallback(company_name, 0.1, f'Error: {error}')
     
     def _default_result(self, company_name: str) -> Dict:
         """Default result when no matches found"""
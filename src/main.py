@@ -1,18 +1,45 @@
 
 import argparse, csv, os, re, yaml
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from urllib.parse import urlparse, quote_plus
 from datetime import datetime, timedelta, timezone
 import requests, feedparser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .utils import parse_date, utc_now, normalize
-from .storage import get_conn, seen_url, save_event
-from .matcher import best_company_match
+from .storage import get_conn, seen_url, save_event_many, load_seen_urls
+from .matcher import best_company_match, could_match
 from .event_extract import classify_event, score_severity
-from .slack_delivery import post_slack
+from .slack_delivery import post_slack, post_slack_async, flush_slack
 from .verification import analyze_article_tone, get_tone_emoji
 from .google_knowledge_graph_disambiguation import GoogleKnowledgeGraphDisambiguator
 from .disambiguation import get_verification_emoji
 
+# Company-name filters applied by load_companies. Numeric-only and initials-only names are
+# rejected by one match; the named group says which rule fired, for verbose logging.
+REJECTED_NAME_RE = re.compile(r'(?P<numeric>[\d\s\-\.]+)$|(?P<initials>[A-Z]\s*[A-Z]\s*[A-Z]?)$')
+COMMON_WORD_NAMES = frozenset(['the', 'and', 'or', 'for', 'new', 'old', 'big', 'small'])
+
+# "Location (count)" entries in locations_with_counts
+LOCATION_COUNT_RE = re.compile(r"^(.*)\s+\((\d+)\)$")
+
+# Turns a domain label into words for the fallback company name ("acme-labs" -> "acme labs")
+DOMAIN_LABEL_SPACES = str.maketrans("-_", "  ")
+
+# Read buffer for the company CSVs: a few large reads instead of many 8 KiB ones
+CSV_BUFFER_SIZE = 1 << 20
+
+# Concurrent Google News / NewsAPI fetches in run(); override with fetch_workers in config.yaml
+FETCH_WORKERS = 16
+
+# Shared keep-alive session for NewsAPI, sized for the fetch pool
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+
 def parse_locations_with_counts(s: str):
     # Expect "Location A (12); Location B (7)"
     result = []
@@ -21,7 +48,7 @@ def parse_locations_with_counts(s: str):
     for part in [p.strip() for p in s.split(";")]:
         if not part:
             continue
-        m = re.match(r"^(.*)\s+\((\d+)\)$", part)
+        m = LOCATION_COUNT_RE.match(part)
         if m:
             loc = m.group(1).strip()
             cnt = int(m.group(2))
@@ -46,9 +73,10 @@ def choose_primary_location_from_fields(locs_with_counts: str, locs_simple: str)
 
 def infer_delimiter(sample_text: str) -> str:
     # naive: prefer comma, then tab, then semicolon
-    if sample_text.count(",") >= sample_text.count("\t") and sample_text.count(",") >= sample_text.count(";"):
+    commas, tabs, semicolons = sample_text.count(","), sample_text.count("\t"), sample_text.count(";")
+    if commas >= tabs and commas >= semicolons:
         return ","
-    if sample_text.count("\t") >= sample_text.count(";"):
+    if tabs >= semicolons:
         return "\t"
     return ";"
 
@@ -59,20 +87,11 @@ def load_companies(csv_path, locations_csv=None, verbose=False):
     Optionally merges location fields from a separate CSV by domain.
     """
     companies = []
-    # Read input with delimiter inference
-    with open(csv_path, "r", encoding="utf-8") as f:
-        sample = f.read(4096)
-        delim = infer_delimiter(sample)
-        f.seek(0)
-        reader = csv.DictReader(f, delimiter=delim)
-        rows = list(reader)
-    if verbose:
-        print(f"[INFO] Input delimiter guessed as '{delim}' with {len(rows)} rows")
 
     # Build fast lookup for locations by domain if provided
     loc_map = {}
     if locations_csv:
-        with open(locations_csv, "r", encoding="utf-8") as lf:
+        with open(locations_csv, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as lf:
             sample2 = lf.read(4096); d2 = infer_delimiter(sample2); lf.seek(0)
             lreader = csv.DictReader(lf, delimiter=d2)
             for r in lreader:
@@ -83,89 +102,103 @@ def load_companies(csv_path, locations_csv=None, verbose=False):
                 locs_wc = normalize(r.get("locations_with_counts") or "")
                 loc_map[dom] = {"locations": locs, "locations_with_counts": locs_wc}
 
-    for row in rows:
-        # Map columns from either format
-        name = normalize(row.get("company_name") or row.get("enriched_company_name"))
-        website = normalize(row.get("website") or row.get("wikidata_official_site") or row.get("homepage_url"))
-        raw_domains = normalize(row.get("domains") or row.get("domain"))
-        domains = []
-        if raw_domains:
-            # split by ';' or ','
-            parts = []
-            if ";" in raw_domains:
-                parts = [p.strip() for p in raw_domains.split(";")]
-            elif "," in raw_domains:
-                parts = [p.strip() for p in raw_domains.split(",")]
-            else:
-                parts = [raw_domains]
-            for p in parts:
-                p = p.replace("https://","").replace("http://","").replace("www.","").strip("/").strip()
-                if p:
-                    domains.append(p)
-        if not name and domains:
-            base = domains[0].split(".")[0].replace("-", " ").replace("_"," ").title()
-            name = base
-
-        locations = normalize(row.get("locations"))
-        locations_with_counts = normalize(row.get("locations_with_counts"))
-        if (not locations and not locations_with_counts) and domains:
-            lm = loc_map.get(domains[0])
-            if lm:
-                locations = lm.get("locations") or ""
-                locations_with_counts = lm.get("locations_with_counts") or ""
-
-        company = {
-            "company_name": name,
-            "website": website,
-            "domains": domains,
-            "notes": normalize(row.get("notes")),
-            "locations": locations,
-            "locations_with_counts": locations_with_counts
-        }
-        if company["domains"]:
-            # Enhanced filtering to reduce false positives
-            if name:
-                # Filter out companies whose names are only numbers
-                if re.match(r'^[\d\s\-\.]+$', name):
-                    if verbose:
-                        print(f"[INFO] Skipping company with numeric name: {name}")
-                    continue
+    # Read input with delimiter inference, one row at a time
+    with open(csv_path, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        sample = f.read(4096)
+        delim = infer_delimiter(sample)
+        f.seek(0)
+        reader = csv.DictReader(f, delimiter=delim)
+        n_rows = 0
+        for row in reader:
+            n_rows += 1
+            # Map columns from either format
+            name = normalize(row.get("company_name") or row.get("enriched_company_name"))
+            website = normalize(row.get("website") or row.get("wikidata_official_site") or row.get("homepage_url"))
+            raw_domains = normalize(row.get("domains") or row.get("domain"))
+            domains = []
+            if raw_domains:
+                # split by ';' or ','
+                parts = []
+                if ";" in raw_domains:
+                    parts = [p.strip() for p in raw_domains.split(";")]
+                elif "," in raw_domains:
+                    parts = [p.strip() for p in raw_domains.split(",")]
+                else:
+                    parts = [raw_domains]
+                for p in parts:
+                    # Most entries are bare domains; only pay for the replace chain when needed
+                    if "//" in p or "www." in p:
+                        p = p.replace("https://","").replace("http://","").replace("www.","")
+                    p = p.strip("/").strip()
+                    if p:
+                        domains.append(p)
+            if not name and domains:
+                base = domains[0].split(".", 1)[0].translate(DOMAIN_LABEL_SPACES).title()
+                name = base
+
+            locations = normalize(row.get("locations"))
+            locations_with_counts = normalize(row.get("locations_with_counts"))
+            if (not locations and not locations_with_counts) and domains:
+                lm = loc_map.get(domains[0])
+                if lm:
+                    locations = lm.get("locations") or ""
+                    locations_with_counts = lm.get("locations_with_counts") or ""
+
+            company = {
+                "company_name": name,
+                "website": website,
+                "domains": domains,
+                "notes": normalize(row.get("notes")),
+                "locations": locations,
+                "locations_with_counts": locations_with_counts
+            }
+            if company["domains"]:
+                # Enhanced filtering to reduce false positives
+                if name:
+                    rejected = REJECTED_NAME_RE.match(name)
+                    reject_rule = rejected.lastgroup if rejected else None
                 
-                # Filter out very short names that could be ambiguous
-                if len(name.strip()) <= 2:
-                    if verbose:
-                        print(f"[INFO] Skipping company with very short name: {name}")
-                    continue
+                    # Filter out companies whose names are only numbers
+                    if reject_rule == 'numeric':
+                        if verbose:
+                            print(f"[INFO] Skipping company with numeric name: {name}")
+                        continue
                 
-                # Filter out names that look like initials only
-                if re.match(r'^[A-Z]\s*[A-Z]\s*[A-Z]?$', name.strip()):
-                    if verbose:
-                        print(f"[INFO] Skipping company with initials-only name: {name}")
-                    continue
+                    # Filter out very short names that could be ambiguous
+                    if len(name.strip()) <= 2:
+                        if verbose:
+                            print(f"[INFO] Skipping company with very short name: {name}")
+                        continue
                 
-                # Filter out names that are just common words
-                common_words = ['the', 'and', 'or', 'for', 'new', 'old', 'big', 'small']
-                if name.lower().strip() in common_words:
-                    if verbose:
-                        print(f"[INFO] Skipping company with generic name: {name}")
-                    continue
+                    # Filter out names that look like initials only
+                    if reject_rule == 'initials':
+                        if verbose:
+                            print(f"[INFO] Skipping company with initials-only name: {name}")
+                        continue
                 
-                companies.append(company)
-            else:
-                if verbose:
-                    print(f"[INFO] Skipping company with no name")
+                    # Filter out names that are just common words
+                    if name.lower().strip() in COMMON_WORD_NAMES:
+                        if verbose:
+                            print(f"[INFO] Skipping company with generic name: {name}")
+                        continue
+                
+                    companies.append(company)
+                else:
+                    if verbose:
+                        print(f"[INFO] Skipping company with no name")
+    if verbose:
+        print(f"[INFO] Input delimiter guessed as '{delim}' with {n_rows} rows")
     return companies
 
 def google_news_rss(query, lang="en"):
     url = f"https://news.google.com/rss/search?q={quote_plus(query)}&hl={lang}"
     feed = feedparser.parse(url)
-    for e in feed.entries:
-        yield {
-            "title": e.get("title"),
-            "url": e.get("link"),
-            "published_at": e.get("published") or e.get("updated"),
-            "source": "google_news_rss"
-        }
+    return [{
+        "title": e.get("title"),
+        "url": e.get("link"),
+        "published_at": e.get("published") or e.get("updated"),
+        "source": "google_news_rss"
+    } for e in feed.entries]
 
 def newsapi_everything(query, api_key, from_iso):
     if not api_key:
@@ -173,7 +206,7 @@ def newsapi_everything(query, api_key, from_iso):
     endpoint = "https://newsapi.org/v2/everything"
     params = {"q": query, "from": from_iso, "sortBy": "publishedAt", "language": "en", "pageSize": 50}
     headers = {"X-Api-Key": api_key}
-    r = requests.get(endpoint, params=params, headers=headers, timeout=20)
+    r = _SESSION.get(endpoint, params=params, headers=headers, timeout=20)
     r.raise_for_status()
     data = r.json()
     results = []
@@ -186,6 +219,10 @@ def newsapi_everything(query, api_key, from_iso):
         })
     return results
 
+def company_queries(company):
+    # dict.fromkeys drops repeated domains while keeping query order
+    return list(dict.fromkeys([f'"{company["company_name"]}"', *company["domains"]]))
+
 def domain_from_url(url):
     try:
         return urlparse(url).netloc.lower()
@@ -202,6 +239,7 @@ def run(csv_path, config_path, since_days, verbose=False, locations_csv=None):
     min_conf = float(cfg.get("min_confidence", 0.8))
     min_sev = float(cfg.get("min_severity", 0.6))
     false_positive_threshold = float(cfg.get("false_positive_threshold", 0.3))
+    fetch_workers = int(cfg.get("fetch_workers", FETCH_WORKERS))
 
     companies = load_companies(csv_path, locations_csv=locations_csv, verbose=verbose)
     names = [c["company_name"] for c in companies]
@@ -213,168 +251,266 @@ def run(csv_path, config_path, since_days, verbose=False, locations_csv=None):
     name_to_all_locations = {
         c["company_name"]: c.get("locations") or "" for c in companies
     }
+    # First company wins on duplicate names, as the old per-item scan did
+    name_to_domains = {}
+    for c in companies:
+        name_to_domains.setdefault(c["company_name"], c["domains"])
     
-    # Initialize Google Knowledge Graph disambiguator
+    # Initialize Google Knowledge Graph disambiguator; its lookups are cached across runs in a
+    # file next to the events database unless kg_cache_path says otherwise
     google_kg_key = cfg.get("google_knowledge_graph_key", "")
-    disambiguator = GoogleKnowledgeGraphDisambiguator(google_kg_key)
-
-    if verbose:
-        print(f"[INFO] Loaded {len(companies)} companies from {csv_path}")
-
-    conn = get_conn(cfg.get("db_path", "events.db"))
-    since = utc_now() - timedelta(days=since_days or int(cfg.get("since_days", 14)))
-    since_iso = since.isoformat()
+    db_path = cfg.get("db_path", "events.db")
+    kg_cache_path = cfg.get("kg_cache_path") or os.path.join(os.path.dirname(db_path), ".kg_cache.db")
+    disambiguator = GoogleKnowledgeGraphDisambiguator(google_kg_key, cache_path=kg_cache_path)
 
-    for c in companies:
-        name = c["company_name"]
+    conn = None
+    try:
         if verbose:
-            print(f"[INFO] Querying for {name} (domains={len(c['domains'])})")
-        queries = [f'"{name}"']
-        for d in c["domains"]:
-            queries.append(d)
-
-        for q in queries:
-            # Google News RSS
-            for item in google_news_rss(q, lang=lang):
-                published = parse_date(item["published_at"])
-                if published and published.replace(tzinfo=timezone.utc) < since:
-                    continue
-                process_item(item, name, names, min_conf, min_sev, slack_url, conn,
-                             name_to_primary_location, name_to_all_locations, companies, disambiguator, false_positive_threshold, verbose=verbose)
-
-            # NewsAPI (optional)
-            try:
-                for item in newsapi_everything(q, newsapi_key, since_iso):
-                    published = parse_date(item["published_at"])
-                    if published and published.replace(tzinfo=timezone.utc) < since:
-                        continue
-                    process_item(item, name, names, min_conf, min_sev, slack_url, conn,
-                                 name_to_primary_location, name_to_all_locations, companies, disambiguator, false_positive_threshold, verbose=verbose)
-            except Exception as e:
+            print(f"[INFO] Loaded {len(companies)} companies from {csv_path}")
+
+        conn = get_conn(db_path)
+        seen_urls = load_seen_urls(conn)
+        since = utc_now() - timedelta(days=since_days or int(cfg.get("since_days", 14)))
+        since_iso = since.isoformat()
+
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            # Network fetches run ahead in the pool; results are consumed here in company/query
+            # order, so SQLite writes stay on this thread and the output matches a sequential run.
+            # Only a window of companies is submitted ahead, so finished feeds don't pile up in
+            # memory while this thread is slowed down by KG rate limits. A query issued by several
+            # companies in the window is fetched once; its entry holds the futures and a count of
+            # pending companies using them, and is dropped when the last of them is processed.
+            window = max(1, fetch_workers * 2)
+            query_fetches = {}
+            pending = deque()
+            upcoming = iter(companies)
+
+            def submit_company(c):
+                queries = company_queries(c)
+                for q in queries:
+                    entry = query_fetches.get(q)
+                    if entry is None:
+                        entry = query_fetches[q] = [(executor.submit(google_news_rss, q, lang=lang),
+                                                     executor.submit(newsapi_everything, q, newsapi_key, since_iso)), 0]
+                    entry[1] += 1
+                pending.append((c, queries))
+
+            for c in islice(upcoming, window):
+                submit_company(c)
+            while pending:
+                c, queries = pending.popleft()
+                next_company = next(upcoming, None)
+                if next_company is not None:
+                    submit_company(next_company)
+                fetches = []
+                for q in queries:
+                    entry = query_fetches[q]
+                    entry[1] -= 1
+                    if not entry[1]:
+                        del query_fetches[q]
+                    fetches.append(entry[0])
+                name = c["company_name"]
                 if verbose:
-                    print("[NewsAPI] Skipping due to error:", e)
-
-def process_item(item, target_company, all_names, min_conf, min_sev, slack_url, conn,
-                 name_to_primary_location, name_to_all_locations, companies_data, disambiguator, false_positive_threshold, verbose=False):
+                    print(f"[INFO] Querying for {name} (domains={len(c['domains'])})")
+
+                for rss_future, newsapi_future in fetches:
+                    # Google News RSS
+                    qualified = []
+                    for item in rss_future.result():
+                        published = parse_date(item["published_at"])
+                        if published and published.replace(tzinfo=timezone.utc) < since:
+                            continue
+                        candidate = qualify_item(item, name, names, min_conf, min_sev, conn, seen_urls=seen_urls)
+                        if candidate:
+                            qualified.append(candidate)
+                    finalize_items(qualified, slack_url, conn, name_to_primary_location, name_to_all_locations, name_to_domains,
+                                   disambiguator, false_positive_threshold, verbose=verbose)
+
+                    # NewsAPI (optional)
+                    try:
+                        qualified = []
+                        for item in newsapi_future.result():
+                            published = parse_date(item["published_at"])
+                            if published and published.replace(tzinfo=timezone.utc) < since:
+                                continue
+                            candidate = qualify_item(item, name, names, min_conf, min_sev, conn, seen_urls=seen_urls)
+                            if candidate:
+                                qualified.append(candidate)
+                        finalize_items(qualified, slack_url, conn, name_to_primary_location, name_to_all_locations, name_to_domains,
+                                       disambiguator, false_positive_threshold, verbose=verbose)
+                    except Exception as e:
+                        if verbose:
+                            print("[NewsAPI] Skipping due to error:", e)
+
+        flush_slack()
+    finally:
+        # run() is called repeatedly by the in-process scheduler, so release the KG session and
+        # cache file and the events database every time
+        disambiguator.close()
+        if conn is not None:
+            conn.close()
+
+def qualify_item(item, target_company, all_names, min_conf, min_sev, conn, seen_urls=None):
+    """
+    Cheap checks for one feed item: unseen URL, headline matches target_company, severity.
+    Returns the fields finalize_items needs, or None if the item is dropped.
+    """
     title = item.get("title") or ""
     url = item.get("url") or ""
-    if not url or seen_url(conn, url):
-        return
-
-    # Fuzzy match best company referenced by the headline
-    best_name, conf = best_company_match(title, all_names)
+    if not url:
+        return None
+    # seen_urls is the run's in-memory copy of stored URLs; fall back to the DB without it
+    if seen_urls is not None:
+        if url in seen_urls:
+            return None
+    elif seen_url(conn, url):
+        return None
+
+    # Fuzzy match best company referenced by the headline; could_match rejects headlines
+    # that cannot score min_conf against the target before scanning every company name
+    if not could_match(title, target_company, min_conf):
+        return None
+    best_name, conf = best_company_match(title, all_names, min_score=min_conf)
     if conf < min_conf or best_name != target_company:
-        return
+        return None
 
     ev_type, _ = classify_event(title, "")
     severity = score_severity(ev_type, domain_from_url(url))
     if severity < min_sev:
-        return
-
-    published_at = item.get("published_at")
-    evidence = url
-
-    # Get company domains for comprehensive verification
-    company_domains = []
-    for company_data in companies_data:
-        if company_data["company_name"] == best_name:
-            company_domains = company_data["domains"]
-            break
+        return None
 
-    # Comprehensive company verification using Google Knowledge Graph disambiguation
-    test_mode = os.environ.get('GITHUB_ACTIONS') == 'true'
-    
-    # Use the disambiguator passed from main function
-    
-    # Get article context for better disambiguation
-    article_context = title
-    if len(title) < 50:  # If title is short, add some context
-        article_context = f"{title} news article"
-    
-    # Disambiguate company using Google Knowledge Graph
-    disambiguation_result = disambiguator.disambiguate_company(best_name, article_context)
-    
-    is_verified = disambiguation_result['is_verified']
-    verification_note = disambiguation_result['description'] or "Wikidata verification completed"
-    confidence_score = disambiguation_result['confidence']
-    
-    if verbose:
-        print(f"[GOOGLE_KG] Company: {best_name}")
-        print(f"[GOOGLE_KG] Verified: {is_verified}")
-        print(f"[GOOGLE_KG] Confidence: {confidence_score:.2f}")
-        print(f"[GOOGLE_KG] Entity: {disambiguation_result['entity_name']}")
-        print(f"[GOOGLE_KG] Types: {disambiguation_result['entity_type']}")
-        print(f"[GOOGLE_KG] Entity ID: {disambiguation_result['wikidata_id']}")
-    
-    # Tone analysis
-    tone, tone_confidence = analyze_article_tone(title)
-    
-    # Location handling
-    primary_location = name_to_primary_location.get(best_name)
-    all_locations = (name_to_all_locations.get(best_name) or "").strip()
-    
-    # Create enhanced title with verification status and tone
-    verification_prefix = ""
-    if not is_verified:
-        verification_prefix = f"{get_verification_emoji(is_verified, confidence_score)} *UNVERIFIED* ({confidence_score:.2f}) - {verification_note}\n"
-    else:
-        verification_prefix = f"{get_verification_emoji(is_verified, confidence_score)} *VERIFIED* ({confidence_score:.2f}) - {verification_note}\n"
-    
-    tone_info = f"Tone: {get_tone_emoji(tone)} {tone} ({tone_confidence:.2f})"
-    
-    title_augmented = title
-    if all_locations:
-        title_augmented = f"{title}\nLocations: {all_locations}"
-    
-    # Add verification and tone info
-    title_augmented = f"{verification_prefix}{title_augmented}\n{tone_info}"
-
-    row = {
-        "created_at": datetime.utcnow().isoformat(),
-        "published_at": published_at,
-        "company_name": best_name,
-        "company_location": primary_location,
-        "title": title_augmented,
+    # Every qualified item is stored, so later duplicates in this run are skipped from here on
+    if seen_urls is not None:
+        seen_urls.add(url)
+    return {
+        "title": title,
         "url": url,
+        "published_at": item.get("published_at"),
         "source": item.get("source"),
-        "event_type": ev_type,
+        "best_name": best_name,
+        "conf": conf,
+        "ev_type": ev_type,
         "severity": severity,
-        "confidence": conf,
-        "evidence": evidence,
-        "is_verified": is_verified,
-        "verification_note": verification_note,
-        "verification_confidence": confidence_score,
-        "wikidata_id": disambiguation_result.get('wikidata_id', ''),
-        "entity_types": ','.join(disambiguation_result.get('entity_type', [])),
-        "tone": tone,
-        "tone_confidence": tone_confidence
     }
-    save_event(conn, row)
-
-    # Filter out likely false positives before posting to Slack
-    is_likely_false_positive = (
-        confidence_score < false_positive_threshold or  # Configurable confidence threshold
-        (verification_note and "likely false positive" in verification_note.lower()) or  # Explicitly marked as false positive
-        (verification_note and "generic word" in verification_note.lower()) or  # Generic word detection
-        (verification_note and "person name" in verification_note.lower())  # Person name detection
-    )
-    
-    if slack_url and not is_likely_false_positive:
-        try:
+
+def finalize_items(qualified, slack_url, conn, name_to_primary_location, name_to_all_locations, name_to_domains,
+                   disambiguator, false_positive_threshold, verbose=False):
+    """
+    Verify, store and post a batch of qualify_item results in order. The Knowledge Graph
+    lookups, the slow part, run concurrently for the whole batch. The batch's rows are
+    committed in one transaction before any of its Slack posts is queued, so a crash can't
+    leave posted events unsaved (and reposted on the next run).
+    """
+    if not qualified:
+        return
+
+    # Get article context for better disambiguation
+    contexts = []
+    for q in qualified:
+        article_context = q["title"]
+        if len(q["title"]) < 50:  # If title is short, add some context
+            article_context = f"{q['title']} news article"
+        contexts.append((q["best_name"], article_context))
+
+    # Disambiguate companies using Google Knowledge Graph
+    disambiguation_results = disambiguator.disambiguate_companies(contexts)
+
+    rows = []
+    posts = []
+    for q, disambiguation_result in zip(qualified, disambiguation_results):
+        title, url, best_name = q["title"], q["url"], q["best_name"]
+        ev_type, severity = q["ev_type"], q["severity"]
+        published_at = q["published_at"]
+        evidence = url
+
+        # Get company domains for comprehensive verification
+        company_domains = name_to_domains.get(best_name, [])
+
+        # Comprehensive company verification using Google Knowledge Graph disambiguation
+        test_mode = os.environ.get('GITHUB_ACTIONS') == 'true'
+
+        is_verified = disambiguation_result['is_verified']
+        verification_note = disambiguation_result['description'] or "Wikidata verification completed"
+        confidence_score = disambiguation_result['confidence']
+
+        if verbose:
+            print(f"[GOOGLE_KG] Company: {best_name}")
+            print(f"[GOOGLE_KG] Verified: {is_verified}")
+            print(f"[GOOGLE_KG] Confidence: {confidence_score:.2f}")
+            print(f"[GOOGLE_KG] Entity: {disambiguation_result['entity_name']}")
+            print(f"[GOOGLE_KG] Types: {disambiguation_result['entity_type']}")
+            print(f"[GOOGLE_KG] Entity ID: {disambiguation_result['wikidata_id']}")
+
+        # Tone analysis
+        tone, tone_confidence = analyze_article_tone(title)
+
+        # Location handling
+        primary_location = name_to_primary_location.get(best_name)
+        all_locations = (name_to_all_locations.get(best_name) or "").strip()
+
+        # Create enhanced title with verification status and tone
+        verification_prefix = ""
+        if not is_verified:
+            verification_prefix = f"{get_verification_emoji(is_verified, confidence_score)} *UNVERIFIED* ({confidence_score:.2f}) - {verification_note}\n"
+        else:
+            verification_prefix = f"{get_verification_emoji(is_verified, confidence_score)} *VERIFIED* ({confidence_score:.2f}) - {verification_note}\n"
+
+        tone_info = f"Tone: {get_tone_emoji(tone)} {tone} ({tone_confidence:.2f})"
+
+        title_augmented = title
+        if all_locations:
+            title_augmented = f"{title}\nLocations: {all_locations}"
+
+        # Add verification and tone info
+        title_augmented = f"{verification_prefix}{title_augmented}\n{tone_info}"
+
+        row = {
+            "created_at": datetime.utcnow().isoformat(),
+            "published_at": published_at,
+            "company_name": best_name,
+            "company_location": primary_location,
+            "title": title_augmented,
+            "url": url,
+            "source": q["source"],
+            "event_type": ev_type,
+            "severity": severity,
+            "confidence": q["conf"],
+            "evidence": evidence,
+            "is_verified": is_verified,
+            "verification_note": verification_note,
+            "verification_confidence": confidence_score,
+            "wikidata_id": disambiguation_result.get('wikidata_id', ''),
+            "entity_types": ','.join(disambiguation_result.get('entity_type', [])),
+            "tone": tone,
+            "tone_confidence": tone_confidence
+        }
+        rows.append(row)
+
+        # Filter out likely false positives before posting to Slack
+        is_likely_false_positive = (
+            confidence_score < false_positive_threshold or  # Configurable confidence threshold
+            (verification_note and "likely false positive" in verification_note.lower()) or  # Explicitly marked as false positive
+            (verification_note and "generic word" in verification_note.lower()) or  # Generic word detection
+            (verification_note and "person name" in verification_note.lower())  # Person name detection
+        )
+
+        if slack_url and not is_likely_false_positive:
             if verbose:
                 print(f"[SLACK] Posting to Slack: {best_name} (confidence: {confidence_score:.2f})")
-            post_slack(slack_url, title=title_augmented, company=best_name, url=url,
-                       event_type=ev_type, published_at=published_at or "", severity=severity,
-                       location=primary_location, is_verified=is_verified, tone=tone, confidence=confidence_score, wikidata_id=disambiguation_result.get('wikidata_id', ''))
-        except Exception as e:
+            posts.append(dict(title=title_augmented, company=best_name, url=url,
+                              event_type=ev_type, published_at=published_at or "", severity=severity,
+                              location=primary_location, is_verified=is_verified, tone=tone, confidence=confidence_score, wikidata_id=disambiguation_result.get('wikidata_id', '')))
+        elif slack_url and is_likely_false_positive:
             if verbose:
-                print("[Slack] Failed to post:", e)
-    elif slack_url and is_likely_false_positive:
-        if verbose:
-            print(f"[SLACK] Skipping likely false positive: {best_name} (confidence: {confidence_score:.2f}) - {verification_note}")
-    elif not slack_url:
-        if verbose:
-            print("[SLACK] No Slack webhook configured, skipping post")
+                print(f"[SLACK] Skipping likely false positive: {best_name} (confidence: {confidence_score:.2f}) - {verification_note}")
+        elif not slack_url:
+            if verbose:
+                print("[SLACK] No Slack webhook configured, skipping post")
+
+    save_event_many(conn, rows)
+    # Sent by the background sender; failures are reported from there
+    for post in posts:
+        post_slack_async(slack_url, verbose=verbose, **post)
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
@@ -1,7 +1,39 @@
 from rapidfuzz import fuzz, process
 
-def best_company_match(text: str, companies: list[str]) -> tuple[str, float]:
+def best_company_match(text: str, companies: list[str], min_score: float = 0.0) -> tuple[str, float]:
+    """
+    Best company for a headline by token_set_ratio, as (name, score in 0..1).
+    With min_score, RapidFuzz prunes candidates that cannot reach it and ("", 0.0) is returned
+    when none does; callers that reject below min_score anyway get the same outcome faster.
+    """
     if not text or not companies:
         return ("", 0.0)
-    match, score, _ = process.extractOne(text, companies, scorer=fuzz.token_set_ratio)
+    # The 1e-9 slack keeps min_score * 100 from rounding above a score whose score/100 equals min_score.
+    # processor=None compares raw strings on every RapidFuzz version (2.x defaulted extractOne to
+    # default_process), which could_match's bound relies on.
+    best = process.extractOne(text, companies, scorer=fuzz.token_set_ratio, processor=None,
+                              score_cutoff=max(0.0, min_score * 100 - 1e-9))
+    if best is None:
+        return ("", 0.0)
+    match, score, _ = best
     return (match, score/100.0 if score else 0.0)
+
+def could_match(text: str, company: str, min_score: float) -> bool:
+    """
+    Cheap necessary condition for token_set_ratio(text, company) / 100 >= min_score, with the raw
+    (unprocessed) strings that best_company_match scores.
+    With no whitespace token in common the ratio is an indel similarity of the two joined
+    token sets, bounded by 2 * shorter / (sum of lengths), so a long headline that never
+    mentions the company cannot reach min_score and the full scan over all names is skipped.
+    """
+    if min_score <= 0:
+        return True
+    text_tokens = set(text.split())
+    company_tokens = set(company.split())
+    if not text_tokens or not company_tokens:
+        return False
+    if not text_tokens.isdisjoint(company_tokens):
+        return True
+    text_len = sum(map(len, text_tokens)) + len(text_tokens) - 1
+    company_len = sum(map(len, company_tokens)) + len(company_tokens) - 1
+    return 200 * min(text_len, company_len) / (text_len + company_len) >= min_score * 100 - 1e-9
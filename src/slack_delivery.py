@@ -1,40 +1,56 @@
-import json, requests
+import atexit, json, queue, threading, requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .verification import get_tone_emoji
+
+# Shared keep-alive session for webhook posts. Retry's default allowed_methods excludes POST,
+# so only failed connections are retried and a delivered message is never sent twice.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+
+EVENT_EMOJI = {
+    "FUNDING": "🎉",
+    "EXEC_CHANGE": "🧭",
+    "HIRING": "📈",
+    "PRODUCT_LAUNCH": "🚀",
+    "AWARD": "🏆",
+    "PRESS_MENTION": "📰",
+}
+
+# Background sender for post_slack_async: one thread drains the queue in order
+_queue = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+SUPPORT_FLAIR = "Reach out privately and offer support. Keep the tone compassionate."
+FLAIR = {
+    "FUNDING": "Congratulate them! 🎉",
+    "PRODUCT_LAUNCH": "Give them a shoutout or offer demo space.",
+    "AWARD": "Congratulate them! 🏆",
+    "HIRING": "Congratulate them and consider amplifying openings to the community.",
+    "EXEC_CHANGE": "Share a note; welcome them or support the transition.",
+    "LAYOFFS": SUPPORT_FLAIR,
+    "SECURITY_INCIDENT": SUPPORT_FLAIR,
+}
+DEFAULT_FLAIR = "Consider a friendly shoutout."
 
 def flair_for_event(event_type: str) -> str:
-    et = (event_type or "").upper()
-    if et == "FUNDING":
-        return "Congratulate them! 🎉"
-    if et == "PRODUCT_LAUNCH":
-        return "Give them a shoutout or offer demo space."
-    if et == "AWARD":
-        return "Congratulate them! 🏆"
-    if et == "HIRING":
-        return "Congratulate them and consider amplifying openings to the community."
-    if et == "EXEC_CHANGE":
-        return "Share a note; welcome them or support the transition."
-    if et in ("LAYOFFS", "SECURITY_INCIDENT"):
-        return "Reach out privately and offer support. Keep the tone compassionate."
-    return "Consider a friendly shoutout."
+    return FLAIR.get((event_type or "").upper(), DEFAULT_FLAIR)
 
 
 def post_slack(webhook_url: str, *, title: str, company: str, url: str, event_type: str, published_at: str, severity: float, location: str | None = None, is_verified: bool = True, tone: str = "NEUTRAL", confidence: float = 1.0, wikidata_id: str = ""):
     ts = published_at or datetime.utcnow().isoformat()
-    emoji = {
-        "FUNDING": "🎉",
-        "EXEC_CHANGE": "🧭",
-        "HIRING": "📈",
-        "PRODUCT_LAUNCH": "🚀",
-        "AWARD": "🏆",
-        "PRESS_MENTION": "📰",
-    }.get(event_type, "📰")
+    emoji = EVENT_EMOJI.get(event_type, "📰")
 
     location_suffix = f" in {location}" if location else ""
     
     # Add verification status and tone to the message
     verification_emoji = "✅" if is_verified else "⚠️"
     verification_status = f"{verification_emoji} VERIFIED ({confidence:.2f})" if is_verified else f"{verification_emoji} UNVERIFIED ({confidence:.2f})"
-    tone_emoji = {"POSITIVE": "✅", "NEGATIVE": "⚠️", "NEUTRAL": "ℹ️"}.get(tone, "ℹ️")
+    tone_emoji = get_tone_emoji(tone)
     
     # Add Google Knowledge Graph info if available
     entity_info = ""
@@ -43,8 +59,37 @@ def post_slack(webhook_url: str, *, title: str, company: str, url: str, event_ty
     
     text = f"{emoji} *{event_type}: {company}{location_suffix}*\n{verification_status} · Tone: {tone_emoji} {tone}{entity_info}\n{title}\n<{url}|Evidence> · {ts[:10]} · Sev {severity:.2f}\n_{flair_for_event(event_type)}_"
     payload = {"text": text}
-    resp = requests.post(webhook_url, data=json.dumps(payload), headers={"Content-Type": "application/json"})
+    resp = _SESSION.post(webhook_url, data=json.dumps(payload), headers={"Content-Type": "application/json"}, timeout=(3, 10))
     try:
         resp.raise_for_status()
     except Exception as e:
         print("[Slack] Error posting:", e, resp.text)
+
+
+def _slack_worker():
+    while True:
+        webhook_url, kwargs, verbose = _queue.get()
+        try:
+            post_slack(webhook_url, **kwargs)
+        except Exception as e:
+            if verbose:
+                print("[Slack] Failed to post:", e)
+        finally:
+            _queue.task_done()
+
+
+def post_slack_async(webhook_url: str, *, verbose: bool = False, **kwargs):
+    """Queue a post_slack call for the background sender so the caller never waits on the webhook"""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_slack_worker, name="slack-sender", daemon=True)
+            _worker.start()
+            # The sender is a daemon thread; make sure queued posts still go out on exit
+            atexit.register(flush_slack)
+    _queue.put((webhook_url, kwargs, verbose))
+
+
+def flush_slack():
+    """Block until every queued Slack post has been sent"""
+    _queue.join()
@@ -1,10 +1,64 @@
 import re
+import threading
+import time
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dateutil import parser
 
+# Keep-alive session shared by every article fetch (disambiguation and verification), so news
+# sites that repeat reuse their connections. Transient 5xx responses are retried with a short
+# backoff; 429s are not, and Retry-After is ignored, so a host asking for a long pause can't
+# stall a fetch inside session.get (per-host pacing is wait_for_host's job)
+ARTICLE_SESSION = requests.Session()
+ARTICLE_SESSION.headers['User-Agent'] = 'Mozilla/5.0 (compatible; MemberMoments/1.0; +https://github.com/pbouffaut/Member-Moments)'
+_ARTICLE_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                               max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                                                 respect_retry_after_header=False))
+ARTICLE_SESSION.mount('https://', _ARTICLE_ADAPTER)
+ARTICLE_SESSION.mount('http://', _ARTICLE_ADAPTER)
+
+# Minimum spacing between article fetches to the same news site, across all callers
+FETCH_INTERVAL = 0.5
+_HOST_LAST_FETCH: Dict[str, float] = {}
+_HOST_LOCK = threading.Lock()
+
+def wait_for_host(url: str) -> None:
+    """Keep requests to the same host at least FETCH_INTERVAL apart; other hosts don't wait"""
+    host = urlparse(url).netloc
+    with _HOST_LOCK:
+        now = time.monotonic()
+        slot = max(now, _HOST_LAST_FETCH.get(host, float('-inf')) + FETCH_INTERVAL)
+        _HOST_LAST_FETCH[host] = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+# Feed timestamp formats parsed without dateutil: NewsAPI's ISO 8601 and Google News' RFC 2822.
+# "-0000" is left to dateutil, which reads it as UTC where the email parser returns a naive time.
+ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?(?:Z|[+-]\d{2}:\d{2})?")
+RFC2822_DATETIME_RE = re.compile(
+    r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), \d{2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) "
+    r"\d{4} \d{2}:\d{2}:\d{2} (?:GMT|\+\d{4}|-(?!0000)\d{4})"
+)
+
 def parse_date(dt_str):
     if not dt_str:
         return None
+    # Fast paths give the same datetime as dateutil; out-of-range fields fall through to it
+    if ISO_DATETIME_RE.fullmatch(dt_str):
+        try:
+            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    elif RFC2822_DATETIME_RE.fullmatch(dt_str):
+        try:
+            return parsedate_to_datetime(dt_str)
+        except (TypeError, ValueError):
+            pass
     try:
         return parser.parse(dt_str)
     except Exception:
@@ -3,6 +3,37 @@ import requests
 from typing import Tuple, List, Optional
 from urllib.parse import urlparse
 import time
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from .utils import ARTICLE_SESSION, wait_for_host
+
+# Verification results by (url, company domains), kept for an hour. Only definite answers
+# are cached: domain found / not found, and articles that are gone (404/410).
+VERIFY_CACHE_SIZE = 10000
+VERIFY_CACHE_TTL = 3600
+_verify_cache = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+def _verify_cache_get(key):
+    with _verify_cache_lock:
+        entry = _verify_cache.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires < time.time():
+            del _verify_cache[key]
+            return None
+        _verify_cache.move_to_end(key)
+        return result
+
+def _verify_cache_put(key, result):
+    with _verify_cache_lock:
+        _verify_cache[key] = (time.time() + VERIFY_CACHE_TTL, result)
+        _verify_cache.move_to_end(key)
+        if len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
 
 def extract_domain_from_url(url: str) -> str:
     """Extract clean domain from URL"""
@@ -15,6 +46,31 @@ def extract_domain_from_url(url: str) -> str:
     except:
         return ""
 
+VERIFY_CHUNK_SIZE = 16384
+
+def _find_domain_in_response(response, company_domains: List[str]) -> Optional[str]:
+    """
+    Read the lowercased article body in chunks and stop at the earliest chunk containing any
+    company domain, returning the first domain (in list order) found in that chunk, so the
+    rest of the page is not downloaded. A tail of the previous chunk is kept so a domain split
+    across two chunks is still found. Without a declared charset the whole body is decoded
+    and the first domain in list order found anywhere in it is returned.
+    """
+    needles = [(domain, domain.lower()) for domain in company_domains]
+    if response.encoding is None:
+        # No declared charset: response.text would guess one from the whole body
+        content = response.text.lower()
+        return next((domain for domain, needle in needles if needle in content), None)
+    overlap = max(len(needle) for _, needle in needles) - 1
+    tail = ""
+    for chunk in response.iter_content(chunk_size=VERIFY_CHUNK_SIZE, decode_unicode=True):
+        window = tail + chunk.lower()
+        for domain, needle in needles:
+            if needle in window:
+                return domain
+        tail = window[-overlap:] if overlap > 0 else ""
+    return None
+
 def verify_domain_in_article(url: str, company_domains: List[str], verbose: bool = False, test_mode: bool = False) -> Tuple[bool, str]:
     """
     Check if any of the company domains appear in the article content.
@@ -27,119 +83,173 @@ def verify_domain_in_article(url: str, company_domains: List[str], verbose: bool
     if test_mode:
         return True, "Test mode - verification simulated"
     
+    cache_key = (url, frozenset(d.lower() for d in company_domains))
+    cached = _verify_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        # Add a small delay to be respectful to news sites
-        time.sleep(0.5)
+        # Be respectful to news sites: space out repeat hits to the same host
+        wait_for_host(url)
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; MemberMoments/1.0; +https://github.com/pbouffaut/Member-Moments)'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        content = response.text.lower()
+        with ARTICLE_SESSION.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            domain = _find_domain_in_response(response, company_domains)
         
-        # Check if any company domain appears in the article
-        for domain in company_domains:
-            if domain.lower() in content:
-                if verbose:
-                    print(f"[VERIFY] Domain '{domain}' found in article")
-                return True, f"Domain '{domain}' verified in article"
+        if domain is not None:
+            if verbose:
+                print(f"[VERIFY] Domain '{domain}' found in article")
+            result = (True, f"Domain '{domain}' verified in article")
+            _verify_cache_put(cache_key, result)
+            return result
         
         if verbose:
             print(f"[VERIFY] No company domains found in article content")
-        return False, "Company domain not found in article content"
+        result = (False, "Company domain not found in article content")
+        _verify_cache_put(cache_key, result)
+        return result
         
     except requests.exceptions.RequestException as e:
         if verbose:
             print(f"[VERIFY] Error fetching article: {e}")
-        return False, f"Could not verify: {str(e)}"
+        result = (False, f"Could not verify: {str(e)}")
+        # A missing article stays missing; other errors may be transient and are retried next time
+        if isinstance(e, requests.exceptions.HTTPError) and e.response is not None and e.response.status_code in (404, 410):
+            _verify_cache_put(cache_key, result)
+        return result
     except Exception as e:
         if verbose:
             print(f"[VERIFY] Unexpected error: {e}")
         return False, f"Verification error: {str(e)}"
 
+# Positive tone indicators
+POSITIVE_TONE_PATTERNS = (
+    # Financial growth
+    r'\braise[sd]?\b', r'\brise[sd]?\b', r'\bgain[sd]?\b', r'\bclimb[sd]?\b',
+    r'\bsurge[sd]?\b', r'\bsoar[sd]?\b', r'\bjump[sd]?\b', r'\bleap[sd]?\b',
+    r'\bgrowth\b', r'\bexpand[sd]?\b', r'\bexpansion\b', r'\bprofit[s]?\b',
+    r'\brevenue\b', r'\bearnings\b', r'\bup\b', r'\bhigher\b', r'\bstrong\b',
+    
+    # Business success
+    r'\bfund(?:ed|ing)\b', r'\bacquire[d]?\b', r'\bpartnership\b', r'\bcollaboration\b',
+    r'\bsuccess\b', r'\bsuccessful\b', r'\bwin[s]?\b', r'\bwon\b', r'\baward[s]?\b',
+    r'\bachievement\b', r'\bmilestone\b', r'\bbreakthrough\b', r'\binnovation\b',
+    
+    # Product launches
+    r'\blaunch[esd]?\b', r'\brelease[sd]?\b', r'\bunveil[sd]?\b', r'\bintroduce[sd]?\b',
+    r'\bnew\b', r'\binnovative\b', r'\bexciting\b', r'\bamazing\b', r'\boutstanding\b',
+    r'\bexcellent\b', r'\bbrilliant\b', r'\bfantastic\b', r'\bwonderful\b',
+    
+    # General positive
+    r'\bpositive\b', r'\bgood\b', r'\bgreat\b', r'\bawesome\b', r'\bterrific\b',
+    r'\bperfect\b', r'\bideal\b', r'\boptimal\b', r'\bbest\b', r'\btop\b'
+)
+
+# Negative tone indicators
+NEGATIVE_TONE_PATTERNS = (
+    # Financial decline
+    r'\bfall[s]?\b', r'\bdecline[sd]?\b', r'\bdrop[sd]?\b', r'\bplunge[sd]?\b',
+    r'\bcrash[esd]?\b', r'\bslump[sd]?\b', r'\btumble[sd]?\b', r'\bslide[sd]?\b',
+    r'\bloss\b', r'\blosses\b', r'\blosing\b', r'\blost\b',
+    r'\bdecrease[sd]?\b', r'\breduce[sd]?\b', r'\breduction\b',
+    r'\bdown\b', r'\blower\b', r'\bweak\b', r'\bweaken[ed]?\b',
+    
+    # Stock market specific
+    r'\bshare[s]?\s+fall[sd]?\b', r'\bstock\s+fall[sd]?\b', r'\bprice\s+fall[sd]?\b',
+    r'\bafter\s*[-]?hours?\b', r'\binsider\s+sell[ing]?\b', r'\bsell[ing]?\s+stock\b',
+    r'\bmarket\s+decline\b', r'\bbear\s+market\b', r'\bcorrection\b',
+    
+    # Business problems
+    r'\blayoff[s]?\b', r'\bbreach\b', r'\battack\b', r'\bhack[ed]?\b',
+    r'\bsecurity\s+incident\b', r'\bdata\s+breach\b', r'\bcyber\s+attack\b',
+    r'\bfraud\b', r'\bscandal\b', r'\bcontroversy\b', r'\blawsuit\b',
+    r'\bshutdown\b', r'\bbankruptcy\b', r'\bfailure\b', r'\bfailed\b',
+    r'\bstruggl[esd]?\b', r'\btrouble[sd]?\b', r'\bproblem[s]?\b',
+    r'\bissue[s]?\b', r'\bconcern[s]?\b', r'\brisk[s]?\b', r'\bdanger\b',
+    
+    # General negative
+    r'\bnegative\b', r'\bbad\b', r'\bterrible\b', r'\bawful\b', r'\bhorrible\b',
+    r'\bdisaster\b', r'\bcrisis\b', r'\bemergency\b', r'\bpanic\b', r'\bfear\b'
+)
+
+# Neutral/balanced indicators
+NEUTRAL_TONE_PATTERNS = (
+    # Administrative changes
+    r'\bappoint[sd]?\b', r'\bjoin[sd]?\b', r'\bannounce[sd]?\b', r'\bannouncement\b',
+    r'\bhire[sd]?\b', r'\bhire[d]?\b', r'\bpromote[sd]?\b', r'\bpromotion\b',
+    r'\bresign[sd]?\b', r'\bresignation\b', r'\bleave[sd]?\b', r'\bdeparture\b',
+    
+    # Business transactions
+    r'\bpartnership\b', r'\bcollaboration\b', r'\bmerger\b', r'\bacquisition\b',
+    r'\binvestment\b', r'\bdeal\b', r'\bagreement\b', r'\bcontract\b',
+    r'\btransaction\b', r'\bexchange\b', r'\btrade\b', r'\bpurchase\b',
+    
+    # General business
+    r'\bquarterly\b', r'\bannual\b', r'\bmonthly\b', r'\bupdate\b',
+    r'\breport[sd]?\b', r'\bstatement\b', r'\bresults\b', r'\bperformance\b'
+)
+
+# \b...\b over letters only: every match of such a pattern is one whole word
+SINGLE_WORD_PATTERN_RE = re.compile(r"\\b[a-z\[\]()?:|]+\\b")
+
+def _compile_tone_patterns(patterns):
+    """
+    Split one polarity into (word_re, word_res, phrase_res). Single-word patterns match whole
+    words only, so they are counted per token through _tone_word_counts; word_re, their fused
+    alternation, rejects most tokens with one fullmatch. Multi-word patterns can overlap
+    those words ("shares fall") and keep their own findall scans.
+    """
+    words = [p for p in patterns if SINGLE_WORD_PATTERN_RE.fullmatch(p)]
+    phrases = [p for p in patterns if not SINGLE_WORD_PATTERN_RE.fullmatch(p)]
+    word_re = re.compile("|".join(f"(?:{p})" for p in words), re.IGNORECASE)
+    word_res = [re.compile(p, re.IGNORECASE) for p in words]
+    phrase_res = [re.compile(p, re.IGNORECASE) for p in phrases]
+    return word_re, word_res, phrase_res
+
+TONES = (
+    _compile_tone_patterns(POSITIVE_TONE_PATTERNS),
+    _compile_tone_patterns(NEGATIVE_TONE_PATTERNS),
+    _compile_tone_patterns(NEUTRAL_TONE_PATTERNS),
+)
+
+# Maximal word-character runs: exactly the spans a single-word pattern can match
+TOKEN_RE = re.compile(r"\w+")
+
+@lru_cache(maxsize=8192)
+def _tone_word_counts(word: str) -> Tuple[int, int, int]:
+    """
+    (positive, negative, neutral) matches for one token: the number of single-word patterns
+    accepting it, so overlapping patterns (hire[sd]? and hire[d]?) each count as before
+    """
+    return tuple(
+        sum(1 for p in word_res if p.fullmatch(word)) if word_re.fullmatch(word) else 0
+        for word_re, word_res, _ in TONES
+    )
+
+def _count_tone_matches(text: str) -> Tuple[int, int, int]:
+    """Per-polarity totals of every tone pattern, as separate findall calls would count them"""
+    positive = negative = neutral = 0
+    for token in TOKEN_RE.findall(text):
+        p, n, u = _tone_word_counts(token)
+        positive += p
+        negative += n
+        neutral += u
+    positive_phrases, negative_phrases, neutral_phrases = (
+        sum(len(p.findall(text)) for p in phrase_res) for _, _, phrase_res in TONES
+    )
+    return positive + positive_phrases, negative + negative_phrases, neutral + neutral_phrases
+
 def analyze_article_tone(title: str, content: str = "") -> Tuple[str, float]:
     """
     Analyze the tone of an article based on title and content.
     Returns (tone, confidence_score)
     """
     text = f"{title or ''} {content or ''}".lower()
-    
-    # Positive tone indicators
-    positive_patterns = [
-        # Financial growth
-        r'\braise[sd]?\b', r'\brise[sd]?\b', r'\bgain[sd]?\b', r'\bclimb[sd]?\b',
-        r'\bsurge[sd]?\b', r'\bsoar[sd]?\b', r'\bjump[sd]?\b', r'\bleap[sd]?\b',
-        r'\bgrowth\b', r'\bexpand[sd]?\b', r'\bexpansion\b', r'\bprofit[s]?\b',
-        r'\brevenue\b', r'\bearnings\b', r'\bup\b', r'\bhigher\b', r'\bstrong\b',
-        
-        # Business success
-        r'\bfund(?:ed|ing)\b', r'\bacquire[d]?\b', r'\bpartnership\b', r'\bcollaboration\b',
-        r'\bsuccess\b', r'\bsuccessful\b', r'\bwin[s]?\b', r'\bwon\b', r'\baward[s]?\b',
-        r'\bachievement\b', r'\bmilestone\b', r'\bbreakthrough\b', r'\binnovation\b',
-        
-        # Product launches
-        r'\blaunch[esd]?\b', r'\brelease[sd]?\b', r'\bunveil[sd]?\b', r'\bintroduce[sd]?\b',
-        r'\bnew\b', r'\binnovative\b', r'\bexciting\b', r'\bamazing\b', r'\boutstanding\b',
-        r'\bexcellent\b', r'\bbrilliant\b', r'\bfantastic\b', r'\bwonderful\b',
-        
-        # General positive
-        r'\bpositive\b', r'\bgood\b', r'\bgreat\b', r'\bawesome\b', r'\bterrific\b',
-        r'\bperfect\b', r'\bideal\b', r'\boptimal\b', r'\bbest\b', r'\btop\b'
-    ]
-    
-    # Negative tone indicators
-    negative_patterns = [
-        # Financial decline
-        r'\bfall[s]?\b', r'\bdecline[sd]?\b', r'\bdrop[sd]?\b', r'\bplunge[sd]?\b',
-        r'\bcrash[esd]?\b', r'\bslump[sd]?\b', r'\btumble[sd]?\b', r'\bslide[sd]?\b',
-        r'\bloss\b', r'\blosses\b', r'\blosing\b', r'\blost\b',
-        r'\bdecrease[sd]?\b', r'\breduce[sd]?\b', r'\breduction\b',
-        r'\bdown\b', r'\blower\b', r'\bweak\b', r'\bweaken[ed]?\b',
-        
-        # Stock market specific
-        r'\bshare[s]?\s+fall[sd]?\b', r'\bstock\s+fall[sd]?\b', r'\bprice\s+fall[sd]?\b',
-        r'\bafter\s*[-]?hours?\b', r'\binsider\s+sell[ing]?\b', r'\bsell[ing]?\s+stock\b',
-        r'\bmarket\s+decline\b', r'\bbear\s+market\b', r'\bcorrection\b',
-        
-        # Business problems
-        r'\blayoff[s]?\b', r'\bbreach\b', r'\battack\b', r'\bhack[ed]?\b',
-        r'\bsecurity\s+incident\b', r'\bdata\s+breach\b', r'\bcyber\s+attack\b',
-        r'\bfraud\b', r'\bscandal\b', r'\bcontroversy\b', r'\blawsuit\b',
-        r'\bshutdown\b', r'\bbankruptcy\b', r'\bfailure\b', r'\bfailed\b',
-        r'\bstruggl[esd]?\b', r'\btrouble[sd]?\b', r'\bproblem[s]?\b',
-        r'\bissue[s]?\b', r'\bconcern[s]?\b', r'\brisk[s]?\b', r'\bdanger\b',
-        
-        # General negative
-        r'\bnegative\b', r'\bbad\b', r'\bterrible\b', r'\bawful\b', r'\bhorrible\b',
-        r'\bdisaster\b', r'\bcrisis\b', r'\bemergency\b', r'\bpanic\b', r'\bfear\b'
-    ]
-    
-    # Neutral/balanced indicators
-    neutral_patterns = [
-        # Administrative changes
-        r'\bappoint[sd]?\b', r'\bjoin[sd]?\b', r'\bannounce[sd]?\b', r'\bannouncement\b',
-        r'\bhire[sd]?\b', r'\bhire[d]?\b', r'\bpromote[sd]?\b', r'\bpromotion\b',
-        r'\bresign[sd]?\b', r'\bresignation\b', r'\bleave[sd]?\b', r'\bdeparture\b',
-        
-        # Business transactions
-        r'\bpartnership\b', r'\bcollaboration\b', r'\bmerger\b', r'\bacquisition\b',
-        r'\binvestment\b', r'\bdeal\b', r'\bagreement\b', r'\bcontract\b',
-        r'\btransaction\b', r'\bexchange\b', r'\btrade\b', r'\bpurchase\b',
-        
-        # General business
-        r'\bquarterly\b', r'\bannual\b', r'\bmonthly\b', r'\bupdate\b',
-        r'\breport[sd]?\b', r'\bstatement\b', r'\bresults\b', r'\bperformance\b'
-    ]
-    
-    def count_matches(patterns):
-        return sum(len(re.findall(p, text, re.IGNORECASE)) for p in patterns)
-    
-    positive_count = count_matches(positive_patterns)
-    negative_count = count_matches(negative_patterns)
-    neutral_count = count_matches(neutral_patterns)
+    # Nothing to match in blank input; skip the pattern scans
+    if not text.strip():
+        return "NEUTRAL", 0.3
+
+    positive_count, negative_count, neutral_count = _count_tone_matches(text)
     
     # Determine tone based on pattern counts with weighted scoring
     # Give more weight to negative patterns as they're often more significant
@@ -162,13 +272,15 @@ def analyze_article_tone(title: str, content: str = "") -> Tuple[str, float]:
         # Default to neutral with low confidence if unclear
         return "NEUTRAL", 0.3
 
+TONE_EMOJI = {
+    "POSITIVE": "✅",
+    "NEGATIVE": "⚠️",
+    "NEUTRAL": "ℹ️"
+}
+
 def get_tone_emoji(tone: str) -> str:
     """Get appropriate emoji for tone"""
-    return {
-        "POSITIVE": "✅",
-        "NEGATIVE": "⚠️",
-        "NEUTRAL": "ℹ️"
-    }.get(tone, "ℹ️")
+    return TONE_EMOJI.get(tone, "ℹ️")
 
 def get_verification_emoji(is_verified: bool) -> str:
     """Get emoji for verification status"""